@@ -12,15 +12,19 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+from . import history_store
+
 class CEALearningSystem:
     def __init__(self, config: Dict):
         self.config = config
+        self._paranoid_save = history_store.paranoid_save_enabled(config)
         self.cea_dir = Path("data/cea_calculation")
         self.cea_dir.mkdir(exist_ok=True)
         
         # 履歴ファイルの初期化
         self.history_file = self.cea_dir / "cea_calculations.json"
         self.calculation_history = self._load_calculation_history()
+        self._stats_cache = None  # (履歴リスト, 件数, 統計結果)
         
         # 学習目標の初期化
         self.learning_goals = self._initialize_learning_goals()
@@ -883,7 +887,7 @@ class CEALearningSystem:
         
         # ファイルに保存
         self._save_calculation(result)
-        self._save_calculation_history()
+        self._append_calculation_history(result)
         
         print(f"\n✅ CEA計算結果を記録しました!")
         print(f"   🔥 燃料: {fuel}")
@@ -1046,22 +1050,24 @@ class CEALearningSystem:
                 goal['current'] = 1
     
     def _load_calculation_history(self) -> List[Dict]:
-        """計算履歴を読み込み"""
-        if self.history_file.exists():
-            try:
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get('calculations', [])
-            except Exception as e:
-                print(f"⚠️ CEA履歴読み込みエラー: {e}")
+        """計算履歴を読み込み（追記ログがあればスナップショットへ集約）"""
+        try:
+            return history_store.load_records(self.history_file, 'calculations', compact=True, fsync=self._paranoid_save)
+        except Exception as e:
+            print(f"⚠️ CEA履歴読み込みエラー: {e}")
         return []
     
     def _save_calculation_history(self):
-        """計算履歴をファイルに保存"""
+        """計算履歴全体をファイルに保存"""
+        try:
+            history_store.write_snapshot(self.history_file, 'calculations', self.calculation_history, self._paranoid_save)
+        except Exception as e:
+            print(f"❌ CEA履歴保存エラー: {e}")
+    
+    def _append_calculation_history(self, result: Dict):
+        """計算履歴に1件追記（履歴全体は書き直さない）"""
         try:
-            data = {'calculations': self.calculation_history}
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            history_store.append_record(self.history_file, result, self._paranoid_save)
         except Exception as e:
             print(f"❌ CEA履歴保存エラー: {e}")
     
@@ -1190,7 +1196,19 @@ class CEALearningSystem:
         return completed_goals
     
     def get_calculation_statistics(self) -> Dict:
-        """計算統計を取得"""
+        """計算統計を取得（履歴が変わっていなければ前回の結果を再利用）"""
+        # 履歴は追記のみ、または丸ごと差し替えられるため、リストの同一性と件数で変更を判定
+        history = self.calculation_history
+        cache = self._stats_cache
+        if cache is not None and cache[0] is history and cache[1] == len(history):
+            return cache[2]
+        
+        stats = self._compute_calculation_statistics()
+        self._stats_cache = (history, len(history), stats)
+        return stats
+    
+    def _compute_calculation_statistics(self) -> Dict:
+        """計算統計を計算"""
         if not self.calculation_history:
             return {'status': 'no_data'}
         
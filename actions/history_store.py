@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+履歴ファイル管理モジュール
+履歴はスナップショット（JSON）と追記ログ（JSON Lines）の2つに分けて保存し、
+記録1件ごとに履歴全体を書き直さないようにする
+
+追記ログの先頭行にはログごとのIDを書き、集約したスナップショットには取り込んだログのIDを残す。
+スナップショットの置き換え後、ログの削除前に終了しても、次回の読み込みで同じ記録を二重に取り込まない。
+"""
+
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+
+LOG_ID_KEY = '__log_id__'  # 追記ログ先頭行のキー
+COMPACTED_LOG_KEY = 'compacted_log'  # スナップショットに取り込み済みのログIDのキー
+
+def paranoid_save_enabled(config: Dict) -> bool:
+    """設定 save.paranoid_save が有効か（有効時は書き込みのたびに fsync して耐久性を優先）"""
+    return bool(config.get('save', {}).get('paranoid_save', False))
+
+def log_path(path: Path) -> Path:
+    """スナップショットに対応する追記ログのパス（例: cea_calculations.jsonl）"""
+    return path.with_suffix('.jsonl')
+
+def _read_log(path: Path):
+    """追記ログを読み込み、(ログID, 記録のリスト) を返す（ログが無ければ (None, [])）"""
+    log_id = None
+    log_records = []
+    try:
+        with open(log_path(path), 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 書き込み途中で終了した行は無視する
+                    continue
+                if LOG_ID_KEY in record:
+                    log_id = record[LOG_ID_KEY]
+                else:
+                    log_records.append(record)
+    except FileNotFoundError:
+        pass
+    return log_id, log_records
+
+def _remove_log(path: Path):
+    """追記ログを削除"""
+    try:
+        os.remove(log_path(path))
+    except FileNotFoundError:
+        pass
+
+def load_records(path: Path, key: str, compact: bool = False, fsync: bool = False) -> List[Dict]:
+    """スナップショットを読み込み、追記ログの記録を後ろに連結して返す
+
+    compact=True のときは、追記ログがあればスナップショットへ集約する。
+    """
+    # バイナリのまま読み込んで json.loads に渡す（空ファイルは解析しない）
+    records = []
+    compacted_log = None
+    try:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                snapshot = json.loads(f.read())
+                records = snapshot.get(key, [])
+                compacted_log = snapshot.get(COMPACTED_LOG_KEY)
+    except FileNotFoundError:
+        pass
+
+    log_id, log_records = _read_log(path)
+    if log_id is not None and log_id == compacted_log:
+        # 前回の集約でスナップショットに取り込み済み（ログの削除前に終了した）ため読み込まない
+        _remove_log(path)
+        return records
+
+    records.extend(log_records)
+    if compact and log_records:
+        write_snapshot(path, key, records, fsync, log_id)
+
+    return records
+
+def append_record(path: Path, record: Dict, fsync: bool = False):
+    """記録1件を追記ログの末尾に1行で書き込み（新しいログは先頭行にログIDを書く）"""
+    with open(log_path(path), 'a', encoding='utf-8') as f:
+        if f.tell() == 0:
+            f.write(json.dumps({LOG_ID_KEY: uuid.uuid4().hex}) + "\n")
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+
+def write_text_atomic(path: Path, text: str, fsync: bool = False):
+    """テキストを一時ファイルに書いてから置き換え（途中で終了しても元のファイルは壊れない）
+
+    fsync=True のときは置き換え前にディスクへの書き込みを待ち、
+    POSIXでは置き換え後にディレクトリも fsync して置き換え自体を確定させる。
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+    if fsync and os.name == 'posix':
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+def write_snapshot(path: Path, key: str, records: List[Dict], fsync: bool = False, log_id: Optional[str] = None):
+    """履歴全体（追記ログの記録を含む）をスナップショットに書き出し、追記ログを削除
+
+    取り込んだログのIDをスナップショットに残すため、削除前に終了しても次回は読み飛ばされる。
+    log_id を省略した場合は現在の追記ログから読み取る。
+    """
+    if log_id is None:
+        log_id, _ = _read_log(path)
+
+    snapshot = {key: records}
+    if log_id is not None:
+        snapshot[COMPACTED_LOG_KEY] = log_id
+    # インデントなしで組み立て、1回の書き込みで出力する
+    write_text_atomic(path, json.dumps(snapshot, ensure_ascii=False, separators=(',', ':')), fsync)
+
+    _remove_log(path)
@@ -13,9 +13,12 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+from . import history_store
+
 class AstronomicalObservationSystem:
     def __init__(self, config: Dict):
         self.config = config
+        self._paranoid_save = history_store.paranoid_save_enabled(config)
         self.optics_dir = Path("data/optics_observations")
         self.optics_dir.mkdir(exist_ok=True)
         
@@ -26,6 +29,7 @@ class AstronomicalObservationSystem:
         # 履歴ファイルの初期化
         self.history_file = self.optics_dir / "optics_observations.json"
         self.observation_history = self._load_observation_history()
+        self._stats_cache = None  # (履歴リスト, 件数, 統計結果)
         
         # 学習目標
         self.learning_goals = self._initialize_learning_goals()
@@ -786,7 +790,7 @@ class AstronomicalObservationSystem:
         
         # ファイルに保存
         self._save_observation_record(result)
-        self._save_observation_history()
+        self._append_observation_history(result)
         
         print(f"\n✅ 天体観測を記録しました!")
         print(f"   🌌 対象: {target_name}")
@@ -985,22 +989,24 @@ class AstronomicalObservationSystem:
                 goal['current'] = 1
     
     def _load_observation_history(self) -> List[Dict]:
-        """観測履歴を読み込み"""
-        if self.history_file.exists():
-            try:
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get('observations', [])
-            except Exception as e:
-                print(f"⚠️ 観測履歴読み込みエラー: {e}")
+        """観測履歴を読み込み（追記ログがあればスナップショットへ集約）"""
+        try:
+            return history_store.load_records(self.history_file, 'observations', compact=True, fsync=self._paranoid_save)
+        except Exception as e:
+            print(f"⚠️ 観測履歴読み込みエラー: {e}")
         return []
     
     def _save_observation_history(self):
-        """観測履歴をファイルに保存"""
+        """観測履歴全体をファイルに保存"""
         try:
-            data = {'observations': self.observation_history}
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            history_store.write_snapshot(self.history_file, 'observations', self.observation_history, self._paranoid_save)
+        except Exception as e:
+            print(f"❌ 観測履歴保存エラー: {e}")
+    
+    def _append_observation_history(self, result: Dict):
+        """観測履歴に1件追記（履歴全体は書き直さない）"""
+        try:
+            history_store.append_record(self.history_file, result, self._paranoid_save)
         except Exception as e:
             print(f"❌ 観測履歴保存エラー: {e}")
     
@@ -1129,7 +1135,19 @@ class AstronomicalObservationSystem:
         return completed_goals
     
     def get_observation_statistics(self) -> Dict:
-        """観測統計を取得"""
+        """観測統計を取得（履歴が変わっていなければ前回の結果を再利用）"""
+        # 履歴は追記のみ、または丸ごと差し替えられるため、リストの同一性と件数で変更を判定
+        history = self.observation_history
+        cache = self._stats_cache
+        if cache is not None and cache[0] is history and cache[1] == len(history):
+            return cache[2]
+        
+        stats = self._compute_observation_statistics()
+        self._stats_cache = (history, len(history), stats)
+        return stats
+    
+    def _compute_observation_statistics(self) -> Dict:
+        """観測統計を計算"""
         if not self.observation_history:
             return {'status': 'no_data'}
         
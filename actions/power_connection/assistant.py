@@ -1,4 +1,4 @@
-import os
+import sys
 import uuid
 import time
 from pathlib import Path
@@ -15,7 +15,10 @@ class PowerConnectionAssistant:
         self.grid = PowerGrid(self.data_dir, self.registry)
         
     def clear_screen(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # 外部コマンドを起動せず、ANSIエスケープで画面消去＋カーソルを左上へ
+        # （WindowsではANSIエスケープの有効化を main.py の起動時に行っている）
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
         
     def print_status(self):
         print("\n" + "="*50)
@@ -12,15 +12,19 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+from . import history_store
+
 class PowerGenerationLearningSystem:
     def __init__(self, config: Dict):
         self.config = config
+        self._paranoid_save = history_store.paranoid_save_enabled(config)
         self.power_dir = Path("data/power_generation")
         self.power_dir.mkdir(exist_ok=True)
         
         # 履歴ファイルの初期化
         self.history_file = self.power_dir / "power_generations.json"
         self.generation_history = self._load_generation_history()
+        self._stats_cache = None  # (履歴リスト, 件数, 統計結果)
         
         # 学習目標
         self.learning_goals = self._initialize_learning_goals()
@@ -659,7 +663,7 @@ class PowerGenerationLearningSystem:
         
         # ファイルに保存
         self._save_generation_record(result)
-        self._save_generation_history()
+        self._append_generation_history(result)
         
         print(f"\n✅ 発電方法を記録しました!")
         print(f"   ⚡ 方法: {method_names[method]}")
@@ -783,22 +787,24 @@ class PowerGenerationLearningSystem:
                 goal['current'] = 1
     
     def _load_generation_history(self) -> List[Dict]:
-        """発電履歴を読み込み"""
-        if self.history_file.exists():
-            try:
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get('generations', [])
-            except Exception as e:
-                print(f"⚠️ 発電履歴読み込みエラー: {e}")
+        """発電履歴を読み込み（追記ログがあればスナップショットへ集約）"""
+        try:
+            return history_store.load_records(self.history_file, 'generations', compact=True, fsync=self._paranoid_save)
+        except Exception as e:
+            print(f"⚠️ 発電履歴読み込みエラー: {e}")
         return []
     
     def _save_generation_history(self):
-        """発電履歴をファイルに保存"""
+        """発電履歴全体をファイルに保存"""
         try:
-            data = {'generations': self.generation_history}
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            history_store.write_snapshot(self.history_file, 'generations', self.generation_history, self._paranoid_save)
+        except Exception as e:
+            print(f"❌ 発電履歴保存エラー: {e}")
+    
+    def _append_generation_history(self, result: Dict):
+        """発電履歴に1件追記（履歴全体は書き直さない）"""
+        try:
+            history_store.append_record(self.history_file, result, self._paranoid_save)
         except Exception as e:
             print(f"❌ 発電履歴保存エラー: {e}")
     
@@ -927,7 +933,19 @@ class PowerGenerationLearningSystem:
         return completed_goals
     
     def get_generation_statistics(self) -> Dict:
-        """発電統計を取得"""
+        """発電統計を取得（履歴が変わっていなければ前回の結果を再利用）"""
+        # 履歴は追記のみ、または丸ごと差し替えられるため、リストの同一性と件数で変更を判定
+        history = self.generation_history
+        cache = self._stats_cache
+        if cache is not None and cache[0] is history and cache[1] == len(history):
+            return cache[2]
+        
+        stats = self._compute_generation_statistics()
+        self._stats_cache = (history, len(history), stats)
+        return stats
+    
+    def _compute_generation_statistics(self) -> Dict:
+        """発電統計を計算"""
         if not self.generation_history:
             return {'status': 'no_data'}
         
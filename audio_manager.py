@@ -30,6 +30,7 @@ class AudioManager:
         self.bgm_thread = None
         self.bgm_playing = False
         self.bgm_files = []
+        self.bgm_names = []  # bgm_files と同じ並びの表示名（拡張子なし）
         
         # 効果音の読み込み
         self.sounds = {}
@@ -76,6 +77,9 @@ class AudioManager:
         if ending_bgm.exists():
             self.bgm_files.append(ending_bgm)
         
+        # 表示名は検索時に一度だけ作成
+        self.bgm_names = [bgm_file.stem for bgm_file in self.bgm_files]
+        
         if self.bgm_files:
             print(f"✅ BGMファイル {len(self.bgm_files)}個 を発見")
         else:
@@ -105,10 +109,7 @@ class AudioManager:
                 return
             bgm_file = random.choice(self.bgm_files)
         
-        if not bgm_file.exists():
-            print(f"⚠️ BGMファイルが見つかりません: {bgm_file.name}")
-            return
-        
+        # 存在確認はせず、読み込みの失敗として扱う
         try:
             # pygameの音楽を直接再生
             pygame.mixer.music.load(str(bgm_file))
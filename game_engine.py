@@ -7,87 +7,153 @@
 
 import json
 import os
+import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
-from audio_manager import AudioManager
-from reality_connector import RealityConnector
+
+from actions.history_store import write_text_atomic
+# audio_manager（pygame）と reality_connector（psutil）は _background_init 内で読み込む
+
+# 称号履歴の保持上限（表示は末尾5件のみのため、古い履歴は読み込み時に破棄する）
+MAX_TITLE_HISTORY = 100
+
+# 称号条件ごとに参照する統計項目（獲得時のスナップショットはこの項目のみ保存）
+_CONDITION_FIELDS = {
+    "crypto_balance >= 1.0": ('crypto_balance',),
+    "cea_count >= 10": ('cea_count',),
+    "plant_count >= 5": ('plant_count',),
+    "solar_plant_count >= 3": ('solar_plant_count',),
+    "wind_plant_count >= 2": ('wind_plant_count',),
+    "optics_count >= 5": ('optics_count',),
+    "energy_generated > energy_consumed": ('energy_generated', 'energy_consumed'),
+    "all_categories_master": ('cea_count', 'plant_count', 'optics_count'),
+}
 
 class GameEngine:
-    def __init__(self, data_dir: Path, assets_dir: Path, save_dir: Path):
+    def __init__(self, data_dir: Path, assets_dir: Path, save_dir: Path, paranoid_save: bool = False):
         self.data_dir = data_dir
         self.assets_dir = assets_dir
         self.save_dir = save_dir
         
+        # 耐久性優先モード（config の save.paranoid_save）では保存のたびに fsync する
+        self.paranoid_save = paranoid_save
+        
         # ゲーム状態ファイル
         self.state_file = Path("state.json")
         self.wallet_file = Path("wallet.json")
         
-        # 音声管理システムの初期化
-        self.audio_manager = AudioManager(data_dir)
-        
-        # 現実連動システムの初期化
-        self.reality_connector = RealityConnector(data_dir)
+        # 音声管理・現実連動システムはバックグラウンドで初期化
+        # （完了までは None のため、利用側は wait_for_background_init() で待機する）
+        self.audio_manager = None
+        self.reality_connector = None
+        self._background_init_done = threading.Event()
+        threading.Thread(target=self._background_init, daemon=True).start()
         
         # 初期化
-        self.load_state()
-        self.load_wallet()
+        self.load_state_and_wallet()
         self.initialize_titles()
+    
+    def _background_init(self):
+        """音声管理・現実連動システムの初期化（起動をブロックしない）"""
+        try:
+            # 音声管理システムの初期化とBGM開始（ファイルがある場合のみ）
+            from audio_manager import AudioManager
+            self.audio_manager = AudioManager(self.data_dir)
+            if self.audio_manager.bgm_files:
+                self.audio_manager.play_bgm()
+        except Exception as e:
+            print(f"❌ 音声システムの初期化に失敗: {e}")
         
-        # BGM開始（ファイルがある場合のみ）
-        if self.audio_manager.bgm_files:
-            self.audio_manager.play_bgm()
-        
-        # 現実連動監視の開始
-        self.reality_connector.start_monitoring()
+        try:
+            # 現実連動システムの初期化と監視開始
+            from reality_connector import RealityConnector
+            self.reality_connector = RealityConnector(self.data_dir)
+            self.reality_connector.start_monitoring()
+        except Exception as e:
+            print(f"❌ 現実連動システムの初期化に失敗: {e}")
+        finally:
+            self._background_init_done.set()
+    
+    def wait_for_background_init(self, timeout: Optional[float] = None) -> bool:
+        """バックグラウンド初期化の完了を待機"""
+        return self._background_init_done.wait(timeout)
+    
+    def _play_effect(self, sound_name: str):
+        """効果音の再生（音声システム初期化前は何もしない）"""
+        if self.audio_manager is not None:
+            self.audio_manager.play_effect(sound_name)
+    
+    def load_state_and_wallet(self):
+        """ゲーム状態とウォレット情報を並行して読み込み（互いに独立したファイルのため）"""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            state_future = executor.submit(self.load_state)
+            wallet_future = executor.submit(self.load_wallet)
+            state_future.result()
+            wallet_future.result()
     
     def load_state(self):
         """ゲーム状態の読み込み"""
         if self.state_file.exists():
             try:
-                with open(self.state_file, 'r', encoding='utf-8') as f:
-                    self.state = json.load(f)
+                with open(self.state_file, 'rb') as f:
+                    self.state = json.loads(f.read())
             except Exception as e:
                 print(f"❌ ゲーム状態の読み込みに失敗: {e}")
-                self.audio_manager.play_effect('error')
+                self._play_effect('error')
                 self.create_default_state()
         else:
             self.create_default_state()
+        
+        # 称号履歴は直近 MAX_TITLE_HISTORY 件のみ保持（次回保存時に反映）
+        title_history = self.state.get('title_history', [])
+        if len(title_history) > MAX_TITLE_HISTORY:
+            self.state['title_history'] = title_history[-MAX_TITLE_HISTORY:]
+        
+        # 獲得済み称号の高速判定用セット（JSON保存用のリストと並行して保持）
+        self._earned_set = set(self.state.get('titles', []))
     
     def create_default_state(self):
         """デフォルトのゲーム状態を作成"""
+        now = datetime.now()
+        now_iso = now.isoformat()
         self.state = {
             "current_day": 1,
             "experience": 0,
             "total_actions": 0,
             "titles": [],
             "story_progress": 0,
-            "last_action_date": datetime.now().isoformat(),
-            "game_start_date": datetime.now().isoformat(),
+            "last_action_date": now_iso,
+            "last_action_epoch": now.timestamp(),
+            "game_start_date": now_iso,
             "achievements": [],
             "quests": [],
             "energy_balance": 0.0
         }
+        self._earned_set = set()
         self.save_state()
     
     def save_state(self):
         """ゲーム状態の保存"""
         try:
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(self.state, f, ensure_ascii=False, indent=2)
+            # 文字列に組み立ててから一時ファイルに書き、置き換える（書き込み途中で終了しても壊れない）
+            write_text_atomic(self.state_file, json.dumps(self.state, ensure_ascii=False, indent=2), self.paranoid_save)
         except Exception as e:
             print(f"❌ ゲーム状態の保存に失敗: {e}")
-            self.audio_manager.play_effect('error')
+            self._play_effect('error')
     
     def load_wallet(self):
         """ウォレット情報の読み込み"""
         if self.wallet_file.exists():
             try:
-                with open(self.wallet_file, 'r', encoding='utf-8') as f:
-                    self.wallet = json.load(f)
+                with open(self.wallet_file, 'rb') as f:
+                    self.wallet = json.loads(f.read())
             except Exception as e:
                 print(f"❌ ウォレット情報の読み込みに失敗: {e}")
-                self.audio_manager.play_effect('error')
+                self._play_effect('error')
                 self.create_default_wallet()
         else:
             self.create_default_wallet()
@@ -111,11 +177,11 @@ class GameEngine:
     def save_wallet(self):
         """ウォレット情報の保存"""
         try:
-            with open(self.wallet_file, 'w', encoding='utf-8') as f:
-                json.dump(self.wallet, f, ensure_ascii=False, indent=2)
+            # 文字列に組み立ててから一時ファイルに書き、置き換える（書き込み途中で終了しても壊れない）
+            write_text_atomic(self.wallet_file, json.dumps(self.wallet, ensure_ascii=False, indent=2), self.paranoid_save)
         except Exception as e:
             print(f"❌ ウォレット情報の保存に失敗: {e}")
-            self.audio_manager.play_effect('error')
+            self._play_effect('error')
     
     def initialize_titles(self):
         """称号システムの初期化"""
@@ -181,6 +247,28 @@ class GameEngine:
                     json.dump(default_titles, f, ensure_ascii=False, indent=2)
             except Exception as e:
                 print(f"❌ 称号ファイルの作成に失敗: {e}")
+        
+        self._load_titles_file()
+    
+    def _load_titles_file(self):
+        """称号ファイルを読み込み、表示用のカテゴリ別グループを作成"""
+        self._titles_by_category = None
+        titles_file = self.assets_dir / "titles.json"
+        
+        if not titles_file.exists():
+            return
+        
+        try:
+            with open(titles_file, 'r', encoding='utf-8') as f:
+                titles_data = json.load(f)
+        except Exception as e:
+            print(f"❌ 称号ファイルの読み込みに失敗: {e}")
+            return
+        
+        categories = defaultdict(list)
+        for title in titles_data.get('titles', []):
+            categories[title.get('category', 'general')].append(title)
+        self._titles_by_category = dict(categories)
     
     def check_titles(self) -> List[Dict]:
         """称号のチェックと付与"""
@@ -194,17 +282,18 @@ class GameEngine:
                 titles_data = json.load(f)
         except Exception as e:
             print(f"❌ 称号ファイルの読み込みに失敗: {e}")
-            self.audio_manager.play_effect('error')
+            self._play_effect('error')
             return []
         
         stats = self.calculate_stats()
         new_titles = []
+        now_iso = datetime.now().isoformat()
         
         for title in titles_data.get('titles', []):
             title_id = title.get('id')
             
             # 既に獲得済みかチェック
-            if title_id in self.state['titles']:
+            if title_id in self._earned_set:
                 continue
             
             # 条件をチェック
@@ -215,9 +304,11 @@ class GameEngine:
                     'name': title['name'],
                     'description': title['description'],
                     'category': title.get('category', 'general'),
-                    'earned_date': datetime.now().isoformat(),
+                    'earned_date': now_iso,
                     'earned_day': self.state['current_day'],
-                    'stats_at_earning': stats.copy()
+                    'stats_at_earning': {
+                        k: stats[k] for k in _CONDITION_FIELDS.get(title.get('condition', ''), ())
+                    }
                 }
                 
                 # 称号履歴に追加
@@ -227,10 +318,11 @@ class GameEngine:
                 
                 # 称号リストに追加
                 self.state['titles'].append(title_id)
+                self._earned_set.add(title_id)
                 new_titles.append(title_info)
                 
                 # 称号獲得時の効果音と詳細通知
-                self.audio_manager.play_effect('title_earned')
+                self._play_effect('title_earned')
                 self._show_title_notification(title_info)
         
         if new_titles:
@@ -241,14 +333,18 @@ class GameEngine:
     
     def _show_title_notification(self, title_info: Dict):
         """称号獲得通知の表示"""
-        print(f"\n" + "="*60)
-        print(f"🏆 新しい称号を獲得しました！")
-        print(f"   📛 {title_info['name']}")
-        print(f"   📝 {title_info['description']}")
-        print(f"   🏷️ カテゴリ: {title_info['category']}")
-        print(f"   📅 獲得日: {self.state['current_day']}日目")
-        print(f"   ⏰ 獲得時刻: {title_info['earned_date'][:19]}")
-        print("="*60)
+        lines = [
+            "",
+            "="*60,
+            "🏆 新しい称号を獲得しました！",
+            f"   📛 {title_info['name']}",
+            f"   📝 {title_info['description']}",
+            f"   🏷️ カテゴリ: {title_info['category']}",
+            f"   📅 獲得日: {self.state['current_day']}日目",
+            f"   ⏰ 獲得時刻: {title_info['earned_date'][:19]}",
+            "="*60,
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def get_title_history(self) -> List[Dict]:
         """称号獲得履歴を取得"""
@@ -256,51 +352,36 @@ class GameEngine:
     
     def show_title_status(self):
         """称号状況の表示"""
-        titles_file = self.assets_dir / "titles.json"
-        
-        if not titles_file.exists():
+        if self._titles_by_category is None:
             print("❌ 称号ファイルが見つかりません")
             return
         
-        try:
-            with open(titles_file, 'r', encoding='utf-8') as f:
-                titles_data = json.load(f)
-        except Exception as e:
-            print(f"❌ 称号ファイルの読み込みに失敗: {e}")
-            return
-        
         stats = self.calculate_stats()
-        earned_titles = set(self.state['titles'])
-        
-        print(f"\n🏆 称号状況 ({self.state['current_day']}日目)")
-        print("="*60)
+        earned_titles = self._earned_set
         
-        # カテゴリ別に表示
-        categories = {}
-        for title in titles_data.get('titles', []):
-            category = title.get('category', 'general')
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(title)
+        lines = [f"\n🏆 称号状況 ({self.state['current_day']}日目)", "="*60]
         
-        for category, titles in categories.items():
-            print(f"\n📂 {category.upper()} カテゴリ:")
+        # カテゴリ別に表示（グループは読み込み時に作成済み）
+        for category, titles in self._titles_by_category.items():
+            lines.append(f"\n📂 {category.upper()} カテゴリ:")
             for title in titles:
                 status = "✅" if title['id'] in earned_titles else "⏳"
-                print(f"   {status} {title['name']}: {title['description']}")
+                lines.append(f"   {status} {title['name']}: {title['description']}")
                 
                 # 未獲得の場合、進捗状況を表示
                 if title['id'] not in earned_titles:
                     progress = self._get_title_progress(title, stats)
                     if progress:
-                        print(f"      📊 進捗: {progress}")
+                        lines.append(f"      📊 進捗: {progress}")
         
         # 称号履歴の表示
         history = self.get_title_history()
         if history:
-            print(f"\n📜 最近獲得した称号:")
+            lines.append(f"\n📜 最近獲得した称号:")
             for title in history[-5:]:  # 最新5個
-                print(f"   🏆 {title['name']} ({title['earned_day']}日目)")
+                lines.append(f"   🏆 {title['name']} ({title['earned_day']}日目)")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def _get_title_progress(self, title: Dict, stats: Dict) -> str:
         """称号の進捗状況を取得"""
@@ -329,14 +410,16 @@ class GameEngine:
     
     def calculate_stats(self) -> Dict:
         """現在の統計を計算"""
-        cea_count = len(self.wallet['cea_calculations'])
-        plant_count = len(self.wallet['plant_designs'])
-        optics_count = len(self.wallet['optics_observations'])
+        wallet = self.wallet
+        plant_designs = wallet['plant_designs']
+        cea_count = len(wallet['cea_calculations'])
+        plant_count = len(plant_designs)
+        optics_count = len(wallet['optics_observations'])
         
         # 発電所タイプ別カウント
-        solar_plant_count = sum(1 for plant in self.wallet['plant_designs'] 
+        solar_plant_count = sum(1 for plant in plant_designs 
                               if plant.get('type') == 'solar')
-        wind_plant_count = sum(1 for plant in self.wallet['plant_designs'] 
+        wind_plant_count = sum(1 for plant in plant_designs 
                              if plant.get('type') == 'wind')
         
         # 全カテゴリマスター判定
@@ -352,9 +435,9 @@ class GameEngine:
             'optics_count': optics_count,
             'solar_plant_count': solar_plant_count,
             'wind_plant_count': wind_plant_count,
-            'crypto_balance': self.wallet['crypto_balance'],
-            'energy_consumed': self.wallet['energy_consumed'],
-            'energy_generated': self.wallet['energy_generated'],
+            'crypto_balance': wallet['crypto_balance'],
+            'energy_consumed': wallet['energy_consumed'],
+            'energy_generated': wallet['energy_generated'],
             'all_categories_master': all_categories_master
         }
     
@@ -388,7 +471,7 @@ class GameEngine:
             self.state['total_actions'] += 1
             self.save_state()
             # 行動選択時の効果音
-            self.audio_manager.play_effect('action_select')
+            self._play_effect('action_select')
             return True
         return False
     
@@ -414,7 +497,7 @@ class GameEngine:
         print("="*50)
         
         # 次の日へ進む時の効果音
-        self.audio_manager.play_effect('next_day')
+        self._play_effect('next_day')
         
         # 今日の振り返り（リセット前）
         today_summary = self.get_today_summary()
@@ -445,31 +528,37 @@ class GameEngine:
     
     def _reset_daily_values(self):
         """日次でリセットする値をクリア"""
+        wallet = self.wallet
+        
         # 累積データを更新
-        self.wallet['total_crypto_balance'] += self.wallet['crypto_balance']
-        self.wallet['total_energy_consumed'] += self.wallet['energy_consumed']
-        self.wallet['total_energy_generated'] += self.wallet['energy_generated']
+        wallet['total_crypto_balance'] += wallet['crypto_balance']
+        wallet['total_energy_consumed'] += wallet['energy_consumed']
+        wallet['total_energy_generated'] += wallet['energy_generated']
         
         # 日次データをリセット
-        self.wallet['crypto_balance'] = 0.0
-        self.wallet['energy_consumed'] = 0.0
-        self.wallet['energy_generated'] = 0.0
-        
-        print("🔄 日次リセット完了:")
-        print(f"   💰 日次Crypto残高: 0.000000 XMR")
-        print(f"   ⚡ 日次消費電力: 0.00 kWh")
-        print(f"   🌞 日次発電量: 0.00 kWh")
-        print(f"   📊 累積Crypto残高: {self.wallet['total_crypto_balance']:.6f} XMR")
-        print(f"   📊 累積消費電力: {self.wallet['total_energy_consumed']:.2f} kWh")
-        print(f"   📊 累積発電量: {self.wallet['total_energy_generated']:.2f} kWh")
+        wallet['crypto_balance'] = 0.0
+        wallet['energy_consumed'] = 0.0
+        wallet['energy_generated'] = 0.0
+        
+        lines = [
+            "🔄 日次リセット完了:",
+            "   💰 日次Crypto残高: 0.000000 XMR",
+            "   ⚡ 日次消費電力: 0.00 kWh",
+            "   🌞 日次発電量: 0.00 kWh",
+            f"   📊 累積Crypto残高: {wallet['total_crypto_balance']:.6f} XMR",
+            f"   📊 累積消費電力: {wallet['total_energy_consumed']:.2f} kWh",
+            f"   📊 累積発電量: {wallet['total_energy_generated']:.2f} kWh",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def get_today_summary(self) -> Dict:
         """今日の行動サマリー"""
         today = self.state['current_day']
+        wallet = self.wallet
         
-        today_cea = [c for c in self.wallet['cea_calculations'] if c.get('day') == today]
-        today_plant = [p for p in self.wallet['plant_designs'] if p.get('day') == today]
-        today_optics = [o for o in self.wallet['optics_observations'] if o.get('day') == today]
+        today_cea = [c for c in wallet['cea_calculations'] if c.get('day') == today]
+        today_plant = [p for p in wallet['plant_designs'] if p.get('day') == today]
+        today_optics = [o for o in wallet['optics_observations'] if o.get('day') == today]
         
         total_xmr_earned = 0
         total_energy_consumed = 0
@@ -528,20 +617,45 @@ class GameEngine:
         }
     
 
+    # 記録系メソッドの契約:
+    #   record_* は状態更新のみ（ファイルI/O・称号チェックなし）
+    #   add_*    は record_* の後に end_action() を1回呼ぶ後方互換ラッパー
+    # 1回の行動で複数の結果を記録する場合は record_* を並べて最後に end_action() を呼ぶ
+
+    def record_cea_result(self, result: Dict):
+        """CEA計算結果を記録（保存・称号チェックなし）"""
+        wallet = self.wallet
+        wallet['cea_calculations'].append(result)
+        wallet['total_cea_time'] += 1  # 計算回数
+    
+    def record_power_plant_result(self, result: Dict):
+        """発電所設計結果を記録（保存・称号チェックなし）"""
+        wallet = self.wallet
+        wallet['plant_designs'].append(result)
+        wallet['energy_generated'] += result.get('annual_generation', 0) / 365  # 日間発電量
+        wallet['total_plant_time'] += 1  # 設計回数
+    
+    def record_optics_observation(self, result: Dict):
+        """天体観測結果を記録（保存・称号チェックなし）"""
+        wallet = self.wallet
+        wallet['optics_observations'].append(result)
+        wallet['total_optics_time'] += result.get('duration_minutes', 0)
+    
+    def end_action(self) -> List[Dict]:
+        """行動1回分の記録後に称号チェックとウォレット保存をまとめて実行"""
+        new_titles = self.check_titles()
+        self.save_wallet()
+        return new_titles
+
     def add_cea_result(self, result: Dict):
         """CEA計算結果を追加"""
-        self.wallet['cea_calculations'].append(result)
-        self.wallet['total_cea_time'] += 1  # 計算回数
-        self.save_wallet()
-        self.check_titles()
+        self.record_cea_result(result)
+        self.end_action()
     
     def add_power_plant_result(self, result: Dict):
         """発電所設計結果を追加"""
-        self.wallet['plant_designs'].append(result)
-        self.wallet['energy_generated'] += result.get('annual_generation', 0) / 365  # 日間発電量
-        self.wallet['total_plant_time'] += 1  # 設計回数
-        self.save_wallet()
-        self.check_titles()
+        self.record_power_plant_result(result)
+        self.end_action()
     
     def add_plant_design(self, result: Dict):
         """発電所設計結果を追加（後方互換性）"""
@@ -549,10 +663,8 @@ class GameEngine:
     
     def add_optics_observation(self, result: Dict):
         """天体観測結果を追加"""
-        self.wallet['optics_observations'].append(result)
-        self.wallet['total_optics_time'] += result.get('duration_minutes', 0)
-        self.save_wallet()
-        self.check_titles()
+        self.record_optics_observation(result)
+        self.end_action()
     
     def add_experience(self, experience: int):
         """経験値を追加"""
@@ -564,7 +676,7 @@ class GameEngine:
         print(f"💎 経験値 +{experience} 獲得! (総経験値: {self.state.get('experience', 0)})")
         
         # 経験値獲得時の効果音
-        self.audio_manager.play_effect('action_select')
+        self._play_effect('action_select')
     
     def add_crypto(self, amount: float):
         """Cryptoを追加"""
@@ -573,41 +685,50 @@ class GameEngine:
         print(f"💰 Crypto +{amount:.6f} XMR 獲得! (残高: {self.wallet['crypto_balance']:.6f} XMR)")
         
         # Crypto獲得時の効果音
-        self.audio_manager.play_effect('action_select')
+        self._play_effect('action_select')
     
     def show_mission_status(self):
         """ミッション状況の表示"""
-        print(f"📊 ミッション統計:")
+        wallet = self.wallet
         
         # 基本統計
-        print(f"   📅 現在の日: {self.state['current_day']}日目")
-        print(f"   💰 日次Crypto残高: {self.wallet['crypto_balance']:.6f} XMR")
-        print(f"   ⚡ 日次消費電力: {self.wallet['energy_consumed']:.2f} kWh")
-        print(f"   🌞 日次発電量: {self.wallet['energy_generated']:.2f} kWh")
+        lines = [
+            "📊 ミッション統計:",
+            f"   📅 現在の日: {self.state['current_day']}日目",
+            f"   💰 日次Crypto残高: {wallet['crypto_balance']:.6f} XMR",
+            f"   ⚡ 日次消費電力: {wallet['energy_consumed']:.2f} kWh",
+            f"   🌞 日次発電量: {wallet['energy_generated']:.2f} kWh",
+        ]
         
         # 累積統計
-        print(f"\n📊 累積統計:")
-        print(f"   💰 累積Crypto残高: {self.wallet.get('total_crypto_balance', 0):.6f} XMR")
-        print(f"   ⚡ 累積消費電力: {self.wallet.get('total_energy_consumed', 0):.2f} kWh")
-        print(f"   🌞 累積発電量: {self.wallet.get('total_energy_generated', 0):.2f} kWh")
+        lines += [
+            "\n📊 累積統計:",
+            f"   💰 累積Crypto残高: {wallet.get('total_crypto_balance', 0):.6f} XMR",
+            f"   ⚡ 累積消費電力: {wallet.get('total_energy_consumed', 0):.2f} kWh",
+            f"   🌞 累積発電量: {wallet.get('total_energy_generated', 0):.2f} kWh",
+        ]
         
         # 活動統計
         stats = self.calculate_stats()
-        print(f"\n📈 活動統計:")
-        print(f"   🚀 CEA計算回数: {stats['cea_count']}回")
-        print(f"   📊 発電監視回数: {stats['plant_count']}回")
-        print(f"   🔭 天体観測回数: {stats['optics_count']}回")
+        lines += [
+            "\n📈 活動統計:",
+            f"   🚀 CEA計算回数: {stats['cea_count']}回",
+            f"   📊 発電監視回数: {stats['plant_count']}回",
+            f"   🔭 天体観測回数: {stats['optics_count']}回",
+        ]
         
         # 称号統計
         earned_titles = len(self.state.get('titles', []))
-        print(f"\n🏆 称号統計:")
-        print(f"   🏆 獲得称号: {earned_titles}個")
+        lines += ["\n🏆 称号統計:", f"   🏆 獲得称号: {earned_titles}個"]
         
         # 経験値統計（存在する場合）
         if 'experience' in self.state:
-            print(f"   💎 総経験値: {self.state['experience']}")
-        
-        print(f"\n💡 ヒント:")
-        print(f"   • 発電監視・ミッションで発電データを記録するとミッションが進行します")
-        print(f"   • ミッションを完了すると経験値とCryptoを獲得できます")
-        print(f"   • 日次・週次・実績ミッションがあります") 
\ No newline at end of file
+            lines.append(f"   💎 総経験値: {self.state['experience']}")
+        
+        lines += [
+            "\n💡 ヒント:",
+            "   • 発電監視・ミッションで発電データを記録するとミッションが進行します",
+            "   • ミッションを完了すると経験値とCryptoを獲得できます",
+            "   • 日次・週次・実績ミッションがあります",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
@@ -10,26 +10,322 @@ import time
 import random
 import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 # 実行場所をスクリプト/実行ファイルのディレクトリに固定
 # （exe配布時に相対パスのdata/assetsが正しく参照されるようにする）
 import sys
+if os.name == 'nt':
+    import msvcrt
+else:
+    import termios
+    import tty
 if getattr(sys, "frozen", False):
     os.chdir(Path(sys.executable).resolve().parent)
 else:
     os.chdir(Path(__file__).resolve().parent)
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+
 from game_engine import GameEngine
-from actions.cea import CEALearningSystem
-from actions.power_plant import PowerGenerationLearningSystem
-from actions.optics import AstronomicalObservationSystem
-from actions.power_plant import PowerMissionSystem
-from actions.world_observer import WorldObserverSystem
-from actions.rocket_research import RocketResearchSystem
-from actions.journal import JournalSystem
-from actions.power_connection.assistant import PowerConnectionAssistant
 from config_manager import ConfigManager
+from actions.history_store import load_records, log_path, paranoid_save_enabled, write_text_atomic
+# 各学習システム（actions.*）は初回アクセス時に読み込む（下記の cached_property を参照）
+
+# ディレクトリ・セーブファイルのパス
+DATA_DIR = Path("data")
+ASSETS_DIR = Path("assets")
+SAVE_DIR = Path("save")
+SAVE_FILE = DATA_DIR / "game_state.json"  # 旧式のセーブファイル（互換性のため、存在しないときだけ作成）
+SAVE_DEBOUNCE_SECONDS = 1.0  # この間隔内の連続保存は1回の書き込みにまとめる
+BACKGROUND_INIT_TIMEOUT = 10.0  # 音声・現実連動システムの初期化を待つ上限（秒）
+
+# 各システムの履歴ファイル
+CEA_HISTORY_FILE = DATA_DIR / "cea_calculation" / "cea_calculations.json"
+POWER_HISTORY_FILE = DATA_DIR / "power_generation" / "power_generations.json"
+OPTICS_HISTORY_FILE = DATA_DIR / "optics_observations" / "optics_observations.json"
+MINING_HISTORY_FILE = DATA_DIR / "mining_activities" / "mining_sessions.json"
+ACTIVITY_LOG_DIR = DATA_DIR / "activity_logs"
+
+# 学習システムの履歴: (システム属性名, 履歴属性名, 履歴ファイル, ファイル内のキー, ウォレットのキー)
+# 記録の追記は各システムが記録時に行う（actions/history_store.py）
+_HISTORY_SOURCES = (
+    ("cea_system", "calculation_history", CEA_HISTORY_FILE, "calculations", "cea_calculations"),
+    ("power_system", "generation_history", POWER_HISTORY_FILE, "generations", "plant_designs"),
+    ("optics_system", "observation_history", OPTICS_HISTORY_FILE, "observations", "optics_observations"),
+)
+
+# 初回起動時に作成する空の履歴ファイル（CEA計算・発電記録・観測記録）
+_HISTORY_INIT = {
+    path: json.dumps({key: []}).encode('utf-8')
+    for _, _, path, key, _ in _HISTORY_SOURCES
+}
+HISTORY_INIT_MARKER = DATA_DIR / ".initialized"  # 履歴ファイル作成済みの目印
+
+# 総行動回数に数えるウォレット内の履歴（CEA計算・発電記録・観測記録・マイニング）
+_HISTORY_WALLET_KEYS = ("cea_calculations", "plant_designs", "optics_observations", "mining_history")
+
+# 起動時に存在を保証するディレクトリ
+_REQUIRED_DIRS = (
+    DATA_DIR,
+    ASSETS_DIR,
+    SAVE_DIR,
+    CEA_HISTORY_FILE.parent,
+    POWER_HISTORY_FILE.parent,
+    OPTICS_HISTORY_FILE.parent,
+    ACTIVITY_LOG_DIR,
+)
+
+# 活動ごとの基本報酬（経験値）と、CEA計算でボーナス対象になる高エネルギー推進剤
+_BASE_REWARDS = {
+    'cea_calculation': 50,
+    'power_generation': 40,
+    'optics_observation': 30,
+    'mining_session': 25
+}
+_HIGH_ENERGY_PROPELLANTS = frozenset(('UDMH', 'F2', 'ClF3', 'N2F4'))
+
+# 画面クリア用のANSIエスケープシーケンス（画面消去＋カーソルを左上へ）
+_CLEAR = "\x1b[2J\x1b[H"
+
+# メニュー表示の固定文字列（表示のたびに組み立てず、1回の書き込みで出力する）
+_MAIN_MENU_HEADER = (
+    "\n🏠 メインメニュー (Day {day})\n"
+    + "="*50 + "\n"
+    + "💎 経験値: {experience}\n"
+    "💰 Crypto: {crypto:.6f} XMR\n"
+)
+
+_MAIN_MENU_ACTIONS = "\n".join([
+    "📋 アクション選択:",
+    "   1. 🚀 CEA計算記録・学習",
+    "   2. ⚡ 発電方法記録・学習",
+    "   3. 🔭 天体観測記録・学習",
+    "   4. 🌍 世界観測（News Sensors）",
+    "   5. 🏭 発電所ミッション",
+    "   6. 🛸 ロケット研究と軌道力学",
+    "   7. 📝 雑記記録",
+    "   8. 📊 統計・履歴表示",
+    "   9. 🎯 学習目標確認",
+    "   10. 🎵 BGM変更",
+    "   11. 💾 ゲーム保存",
+    "   12. 📂 セーブデータ読み込み",
+    "   13. 📅 次の日へ進む",
+    "   14. 🔌 発電接続アシスタント",
+    "   15. ❌ 終了",
+]) + "\n"
+
+# 日次ダッシュボードの推奨アクション（未活動時・活動済み時）
+_RECOMMENDED_ACTIONS_IDLE = (
+    "   🚀 新しい推進剤の組み合わせを試してみましょう",
+    "   ⚡ 発電方法の研究を始めましょう",
+    "   🔭 天体観測で新しい発見をしましょう",
+)
+_RECOMMENDED_ACTIONS_ACTIVE = (
+    "   💪 更なる高みを目指して活動を続けましょう！",
+    "   🎯 学習目標の達成も忘れずに。",
+)
+
+# 日報に表示する新しい日の目標
+_DAILY_GOALS = (
+    "   💪 3つの行動を活用して学習を進めましょう",
+    "   🚀 新しい推進剤の組み合わせを試してみましょう",
+    "   ⚡ 発電方法の研究を深めましょう",
+    "   🔭 天体観測で新しい発見をしましょう",
+    "   ⛏️ マイニングでCryptoを稼ぎましょう",
+)
+
+_CEA_MENU = "\n".join([
+    "\n🚀 CEA計算記録・学習システム",
+    "="*40,
+    "1. 📝 計算結果を記録",
+    "2. 🎯 学習目標を確認",
+    "3. 📚 計算履歴を表示",
+    "4. 📊 統計を表示",
+    "5. 🔥 推進剤リストを表示",
+    "6. 🔙 戻る",
+]) + "\n"
+
+_POWER_MENU = "\n".join([
+    "\n⚡ 発電方法記録・学習システム",
+    "="*40,
+    "1. 📝 発電方法を記録",
+    "2. 🎯 学習目標を確認",
+    "3. 📚 発電履歴を表示",
+    "4. 📊 統計を表示",
+    "5. 📖 発電方法ガイド",
+    "6. 🔙 戻る",
+]) + "\n"
+
+_OPTICS_MENU = "\n".join([
+    "\n🔭 天体観測記録・学習システム",
+    "="*40,
+    "1. 📝 観測を記録",
+    "2. 🎯 学習目標を確認",
+    "3. 📚 観測履歴を表示",
+    "4. 📊 統計を表示",
+    "5. 🔬 光学・天文学理論シミュレーション",
+    "6. 🔙 戻る",
+]) + "\n"
+
+_WORLD_OBSERVATION_MENU = "\n".join([
+    "\n🌍 世界線観測・エネルギー追跡システム",
+    "="*40,
+    "1. 📡 現在の世界状態を観測・記録する",
+    "2. 📊 観測履歴・レポートを表示する",
+    "3. 🔬 世界線・歴史トレンド理論シミュレーション",
+    "4. 🔙 戻る",
+]) + "\n"
+
+_POWER_MISSIONS_MENU = "\n".join([
+    "\n🏭 発電所ミッションシステム",
+    "="*40,
+    "1. 📋 ミッション一覧",
+    "2. 📊 ミッション統計",
+    "3. 💡 ミッションヒント",
+    "4. 🔬 発電・エネルギー理論シミュレーション",
+    "5. 🔙 戻る",
+]) + "\n"
+
+_STATISTICS_MENU = "\n".join([
+    "\n📊 統計・履歴表示",
+    "="*40,
+    "1. 🎮 ゲーム統計",
+    "2. 🚀 CEA統計",
+    "3. ⚡ 発電統計",
+    "4. 🔭 観測統計",
+    "5. 🔙 戻る",
+]) + "\n"
+
+_LEARNING_GOALS_MENU = "\n".join([
+    "\n🎯 学習目標確認",
+    "="*40,
+    "1. 🚀 CEA学習目標",
+    "2. ⚡ 発電学習目標",
+    "3. 🔭 観測学習目標",
+    "4. 🔙 戻る",
+]) + "\n"
+
+_LOAD_GAME_MENU = "\n".join([
+    "\n📂 セーブデータ読み込み",
+    "="*40,
+    "1. 🔄 現在のセーブデータを再読み込み",
+    "2. 📊 セーブデータ情報を表示",
+    "3. 🔍 セーブデータ整合性チェック",
+    "4. 🔧 セーブデータ自動修復",
+    "5. 🔙 戻る",
+]) + "\n"
+
+# 統計表示のテンプレート: 見出しごとに (ラベル, 統計キー, 単位) を並べる
+_STATS_TEMPLATES = {
+    "cea": {
+        "empty": "📝 計算データがありません",
+        "sections": (
+            ("\n📊 CEA計算統計:", (
+                ("総計算回数", "total_calculations", ""),
+                ("ユニーク推進剤", "unique_propellants", ""),
+                ("最高比推力", "max_isp", " s"),
+                ("最高圧力", "max_pressure", " bar"),
+            )),
+            ("\n🚀 推進剤使用統計:", (
+                ("UDMH使用回数", "udmh_usage", ""),
+                ("フッ素(F2)使用回数", "fluorine_usage", ""),
+                ("高エネルギー酸化剤使用回数", "high_energy_oxidizer_usage", ""),
+                ("ヒドラジン族使用回数", "hydrazine_family_usage", ""),
+                ("炭化水素燃料使用回数", "hydrocarbon_usage", ""),
+                ("高濃度酸化剤使用回数", "concentrated_oxidizer_usage", ""),
+                ("危険推進剤使用回数", "dangerous_propellant_usage", ""),
+            )),
+        ),
+    },
+    "power": {
+        "empty": "📝 発電データがありません",
+        "sections": (
+            ("\n📊 発電統計:", (
+                ("総記録数", "total_records", ""),
+                ("ユニーク方法", "unique_methods", ""),
+                ("総容量", "total_capacity", " kW"),
+                ("1日あたり発電量", "total_daily_generation", " kWh"),
+            )),
+        ),
+    },
+    "optics": {
+        "empty": "📝 観測データがありません",
+        "sections": (
+            ("\n📊 天体観測統計:", (
+                ("総観測回数", "total_observations", ""),
+                ("ユニーク天体", "unique_targets", ""),
+                ("カテゴリ数", "unique_categories", ""),
+                ("使用機材", "equipment_types", "種類"),
+            )),
+        ),
+    },
+}
+
+def _history_counts(wallet: Dict) -> Dict[str, int]:
+    """ウォレット内の各履歴の件数（キーは _HISTORY_WALLET_KEYS）"""
+    return {key: len(wallet.get(key, ())) for key in _HISTORY_WALLET_KEYS}
+
+def _render(*lines: str):
+    """複数行をまとめて1回の書き込みで表示"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+def _read_key(prompt: str) -> str:
+    """Enterを待たずにキー1回分の入力を読み取る（端末でない場合は input() で1行読む）"""
+    if not sys.stdin.isatty():
+        return input(prompt).strip()
+    
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    # 1文字を読んだ後、残りの入力（習慣で押したEnter、矢印キーなどのエスケープシーケンス）は捨てる
+    # （残すと、続くハンドラの input() が空行や制御文字を受け取ってしまう）
+    if os.name == 'nt':
+        key = msvcrt.getwch()
+        while msvcrt.kbhit():
+            msvcrt.getwch()
+        if key == '\x03':
+            raise KeyboardInterrupt
+    else:
+        fd = sys.stdin.fileno()
+        old_attrs = termios.tcgetattr(fd)
+        try:
+            # cbreakモードではCtrl+Cのシグナルは有効なまま
+            tty.setcbreak(fd)
+            # sys.stdin を通すと余分な入力がPython側のバッファに残るため、端末から直接読む
+            data = os.read(fd, 64)
+            termios.tcflush(fd, termios.TCIFLUSH)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+        key = data.decode('utf-8', errors='ignore')[:1]
+    
+    # 入力したキーを表示して改行
+    key = key.strip()
+    sys.stdout.write(key + "\n")
+    return key
+
+# 全角数字 → 半角数字（日本語入力のまま数字を入力した場合のため）
+_FULLWIDTH_DIGITS = str.maketrans("０１２３４５６７８９", "0123456789")
+
+def _parse_small_int(text: str, max_value: int) -> int:
+    """1〜2桁の数字入力を 1..max_value の整数に変換（不正な入力は -1）"""
+    text = text.translate(_FULLWIDTH_DIGITS)
+    length = len(text)
+    if length == 1:
+        d0 = ord(text) - 48
+        if not 0 <= d0 <= 9:
+            return -1
+        value = d0
+    elif length == 2:
+        d0 = ord(text[0]) - 48
+        d1 = ord(text[1]) - 48
+        if not (0 <= d0 <= 9 and 0 <= d1 <= 9):
+            return -1
+        value = d0 * 10 + d1
+    else:
+        return -1
+    return value if 1 <= value <= max_value else -1
 
 class CryptoAdventureRPG:
     def __init__(self):
@@ -38,49 +334,49 @@ class CryptoAdventureRPG:
         self.config = self.config_manager.load_config()
         
         # ディレクトリの設定
-        self.data_dir = Path("data")
-        self.assets_dir = Path("assets")
-        self.save_dir = Path("save")
-        
-        # ディレクトリの作成
-        self.data_dir.mkdir(exist_ok=True)
-        self.assets_dir.mkdir(exist_ok=True)
-        self.save_dir.mkdir(exist_ok=True)
+        self.data_dir = DATA_DIR
+        self.assets_dir = ASSETS_DIR
+        self.save_dir = SAVE_DIR
         
-        # 各システム用のディレクトリを作成
-        (self.data_dir / "cea_calculation").mkdir(exist_ok=True)
-        (self.data_dir / "power_generation").mkdir(exist_ok=True)
-        (self.data_dir / "optics_observations").mkdir(exist_ok=True)
-        (self.data_dir / "activity_logs").mkdir(exist_ok=True)
+        # ディレクトリの作成（起動時に一度だけ、存在しないものだけ作成）
+        for directory in _REQUIRED_DIRS:
+            if not os.path.isdir(directory):
+                os.makedirs(directory, exist_ok=True)
         
         # 必要な履歴ファイルを初期化
         self._initialize_history_files()
         
-        self.game_engine = GameEngine(self.data_dir, self.assets_dir, self.save_dir)
-        
-        # 各システムの初期化
-        self.cea_system = CEALearningSystem(self.config)
-        self.power_system = PowerGenerationLearningSystem(self.config)
-        self.optics_system = AstronomicalObservationSystem(self.config)
-        self.power_missions = PowerMissionSystem(self.config)
-        self.world_observer = WorldObserverSystem(self.config)
-        self.rocket_system = RocketResearchSystem(self.config)
-        self.journal_system = JournalSystem(self.config)
-        self.power_connection_system = PowerConnectionAssistant(self.config)
-        
-        # 各システムにGameEngineの参照を設定
-        self.cea_system.set_game_engine(self.game_engine)
-        self.power_system.set_game_engine(self.game_engine)
-        self.optics_system.set_game_engine(self.game_engine)
-        self.world_observer.set_game_engine(self.game_engine)
-        self.power_missions.set_game_engine(self.game_engine)
-        self.rocket_system.set_game_engine(self.game_engine)
-        self.journal_system.set_game_engine(self.game_engine)
+        # 旧式のセーブファイルは内容を読まず存在だけを確認するため、作成済みなら以後は書き込まない
+        self._legacy_saved = os.path.isfile(SAVE_FILE)
+        
+        # 保存の間引き（最後に書き込んだ時刻と、次のメニュー表示時に書き込む保留中の保存があるか）
+        # 保存はすべてメインスレッドで行い、状態の変更と書き込みが重ならないようにする
+        self._last_save = 0.0
+        self._save_pending = False
+        
+        # 耐久性優先モード（config の save.paranoid_save）では書き込みのたびに fsync する
+        self._paranoid_save = paranoid_save_enabled(self.config)
+        
+        # 履歴ファイルの解析結果キャッシュ（パス → (ファイルの更新時刻とサイズ, 記録リスト)）
+        # ファイルが変わっていなければ同期のたびに解析し直さない
+        self._history_cache: Dict[Path, Tuple] = {}
+        
+        # 日付ごとの活動回数の集計キャッシュ（履歴キー → (集計した履歴リスト, 集計済み件数, 日付 → 回数)）
+        # メニューの再描画のたびに履歴全体を数え直さない
+        self._activity_count_cache: Dict[str, Tuple] = {}
+        
+        self.game_engine = GameEngine(self.data_dir, self.assets_dir, self.save_dir, self._paranoid_save)
+        
+        # 各システムは初回アクセス時に生成する（起動時に全モジュールを読み込まない）
         
         # ゲーム状態
         self.current_day = 1
         self.last_action_time = None
         
+        # WindowsコンソールでANSIエスケープを有効化（最初に一度だけ）
+        if os.name == 'nt':
+            os.system('')
+        
         # デバッグモード（ゲーム再起動まで有効）
         self.debug_mode = False
         
@@ -92,25 +388,164 @@ class CryptoAdventureRPG:
         }
         self.consecutive_days_bonus = 0
         
-    def _initialize_history_files(self):
-        """履歴ファイルを初期化"""
-        # CEA計算履歴ファイル
-        cea_file = self.data_dir / "cea_calculation" / "cea_calculations.json"
-        if not cea_file.exists():
-            with open(cea_file, 'w', encoding='utf-8') as f:
-                json.dump({"calculations": []}, f, ensure_ascii=False, indent=2)
-        
-        # 発電記録履歴ファイル
-        power_file = self.data_dir / "power_generation" / "power_generations.json"
-        if not power_file.exists():
-            with open(power_file, 'w', encoding='utf-8') as f:
-                json.dump({"generations": []}, f, ensure_ascii=False, indent=2)
-        
-        # 観測記録履歴ファイル
-        optics_file = self.data_dir / "optics_observations" / "optics_observations.json"
-        if not optics_file.exists():
-            with open(optics_file, 'w', encoding='utf-8') as f:
-                json.dump({"observations": []}, f, ensure_ascii=False, indent=2)        
+        # メニューのディスパッチテーブル（選択肢 → ハンドラ）
+        # メインメニューは (ハンドラ, 実行後にEnter待ちをするか) の組
+        self._main_dispatch = {
+            "1": (self._cea_menu, True),
+            "2": (self._power_menu, True),
+            "3": (self._optics_menu, True),
+            "4": (self._world_observation_menu, True),
+            "5": (self._power_missions_menu, True),
+            "6": (self._rocket_menu, False),
+            "7": (self._journal_menu, False),
+            "8": (self._statistics_menu, True),
+            "9": (self._learning_goals_menu, True),
+            "10": (self._bgm_menu, True),
+            "11": (self._save_game_from_menu, True),
+            "12": (self._load_game_menu, True),
+            "13": (self._advance_to_next_day, True),
+            "14": (self._power_connection_menu, False),
+        }
+        # 学習目標確認・履歴・統計・ガイド表示は行動回数を消費しない
+        self._cea_dispatch = {
+            "1": self._record_cea_calculation,
+            "2": lambda: self.cea_system.show_learning_goals(),
+            "3": lambda: self.cea_system.show_calculation_history(),
+            "4": self._show_cea_statistics,
+            "5": self._show_propellant_list,
+        }
+        self._power_dispatch = {
+            "1": self._record_power_generation,
+            "2": lambda: self.power_system.show_learning_goals(),
+            "3": lambda: self.power_system.show_generation_history(),
+            "4": self._show_power_statistics,
+            "5": lambda: self.power_system.show_power_methods_guide(),
+        }
+        self._optics_dispatch = {
+            "1": self._record_optics_observation,
+            "2": lambda: self.optics_system.show_learning_goals(),
+            "3": lambda: self.optics_system.show_observation_history(),
+            "4": self._show_optics_statistics,
+            "5": lambda: self.optics_system.show_theoretical_simulation_menu(),
+        }
+        self._world_observation_dispatch = {
+            "1": lambda: self.world_observer.observe_and_record(),
+            "2": lambda: self.world_observer.display_world_state(),
+            "3": lambda: self.world_observer.show_theoretical_simulation_menu(),
+        }
+        self._power_missions_dispatch = {
+            "1": lambda: self.power_missions.show_missions(),
+            "2": lambda: self.power_missions.show_mission_statistics(),
+            "3": lambda: self.power_missions.show_mission_hints(),
+            "4": lambda: self.power_missions.show_theoretical_simulation_menu(),
+        }
+        self._statistics_dispatch = {
+            "1": self._show_game_statistics,
+            "2": self._show_cea_statistics,
+            "3": self._show_power_statistics,
+            "4": lambda: self._show_optics_statistics("観測統計"),
+        }
+        self._learning_goals_dispatch = {
+            "1": lambda: self.cea_system.show_learning_goals(),
+            "2": lambda: self.power_system.show_learning_goals(),
+            "3": lambda: self.optics_system.show_learning_goals(),
+        }
+        self._load_game_dispatch = {
+            "1": self._reload_game_state,
+            "2": self._show_save_data_info,
+            "3": self._check_save_data_integrity,
+            "4": self._repair_save_data,
+        }
+        
+    # ---- 各システム（初回アクセス時にモジュールを読み込んで生成し、以後は同じインスタンスを使う） ----
+    @cached_property
+    def cea_system(self):
+        from actions.cea import CEALearningSystem
+        system = CEALearningSystem(self.config)
+        system.set_game_engine(self.game_engine)
+        return system
+    
+    @cached_property
+    def power_system(self):
+        from actions.power_plant import PowerGenerationLearningSystem
+        system = PowerGenerationLearningSystem(self.config)
+        system.set_game_engine(self.game_engine)
+        return system
+    
+    @cached_property
+    def optics_system(self):
+        from actions.optics import AstronomicalObservationSystem
+        system = AstronomicalObservationSystem(self.config)
+        system.set_game_engine(self.game_engine)
+        return system
+    
+    @cached_property
+    def power_missions(self):
+        from actions.power_plant import PowerMissionSystem
+        system = PowerMissionSystem(self.config)
+        system.set_game_engine(self.game_engine)
+        return system
+    
+    @cached_property
+    def world_observer(self):
+        from actions.world_observer import WorldObserverSystem
+        system = WorldObserverSystem(self.config)
+        system.set_game_engine(self.game_engine)
+        return system
+    
+    @cached_property
+    def rocket_system(self):
+        from actions.rocket_research import RocketResearchSystem
+        system = RocketResearchSystem(self.config)
+        system.set_game_engine(self.game_engine)
+        return system
+    
+    @cached_property
+    def journal_system(self):
+        from actions.journal import JournalSystem
+        system = JournalSystem(self.config)
+        system.set_game_engine(self.game_engine)
+        return system
+    
+    @cached_property
+    def power_connection_system(self):
+        from actions.power_connection.assistant import PowerConnectionAssistant
+        return PowerConnectionAssistant(self.config)
+    
+    def _initialize_history_files(self, force: bool = False):
+        """履歴ファイルを初期化（初回起動時のみ、force=True のときは作成済みの目印があっても行う）"""
+        if not force and os.path.isfile(HISTORY_INIT_MARKER):
+            return
+        
+        for path, content in _HISTORY_INIT.items():
+            if force:
+                # 修復時はディレクトリごと削除されている場合もあるため作り直す
+                os.makedirs(path.parent, exist_ok=True)
+            self._create_file_if_missing(path, content)
+        
+        self._create_file_if_missing(HISTORY_INIT_MARKER, b'')
+    
+    def _create_file_if_missing(self, path: Path, content: bytes):
+        """ファイルが無いときだけ作成（存在確認と作成を O_EXCL で1回のopenにまとめる）"""
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return
+        try:
+            os.write(fd, content)
+        finally:
+            os.close(fd)
+    
+    def _restore_history_snapshot(self, path: Path) -> bool:
+        """削除された履歴スナップショットを空の状態で作り直す（作成できたら True）"""
+        try:
+            os.makedirs(path.parent, exist_ok=True)
+            self._create_file_if_missing(path, _HISTORY_INIT[path])
+            return True
+        except OSError as e:
+            print(f"⚠️ 履歴ファイル作成エラー ({path}): {e}")
+            return False
+    
     def _load_config(self) -> Dict:
         """設定ファイルを読み込み（非推奨 - ConfigManagerを使用）"""
         return self.config_manager.load_config()
@@ -120,121 +555,141 @@ class CryptoAdventureRPG:
         print("🚀 Crypto Adventure RPG へようこそ！")
         print("="*50)
         
-        # 設定読み込み
-        self.config = self._load_config()
+        # 設定は __init__ で読み込み済み
         
         # ゲーム状態読み込み
         self._load_game_state()
         
+        # 音声・現実連動システムの初期化メッセージがメニュー表示に混ざらないよう、
+        # 最初のメニュー表示前に初期化の完了を待つ（初期化が止まっても起動は続ける）
+        self.game_engine.wait_for_background_init(BACKGROUND_INIT_TIMEOUT)
+        
         # メインメニュー表示
         self._show_main_menu()
         
-        # ゲーム終了時に自動保存
+        # ゲーム終了時に自動保存（バックグラウンド初期化の完了を待ってから、ただし待ち続けない）
+        self.game_engine.wait_for_background_init(BACKGROUND_INIT_TIMEOUT)
         print("\n💾 ゲームを保存中...")
-        self._save_game_state()
+        self._save_game_state(force=True)
         print("✅ ゲームを保存しました")
     
     def _load_game_state(self):
         """ゲーム状態を読み込み"""
         # GameEngineの状態を読み込み（これがメインのセーブデータ）
-        self.game_engine.load_state()
-        self.game_engine.load_wallet()
+        self.game_engine.load_state_and_wallet()
         
         # 履歴データを同期
         self._sync_history_data()
         
-        # main.pyの状態をGameEngineと同期
-        self.current_day = self.game_engine.state.get('current_day', 1)
+        # main.pyの状態をGameEngineと同期（読み込み後の状態辞書をローカルに束縛）
+        state = self.game_engine.state
+        self.current_day = state.get('current_day', 1)
         
         # 日付チェック（最終行動日から経過日数を計算）
-        last_action_date = self.game_engine.state.get('last_action_date')
-        if last_action_date:
-            try:
-                last_time = datetime.fromisoformat(last_action_date)
-                now = datetime.now()
-                days_diff = (now - last_time).days
-                
-                if days_diff >= 1:
-                    print(f"📅 {days_diff}日経過しました。新しい日の始まりです！")
-                    # 新しい日の処理はGameEngineで行われるため、ここでは表示のみ
-            except Exception as e:
-                print(f"⚠️ 日付チェックエラー: {e}")
+        # UNIX時刻が保存されていれば算術だけで求め、旧セーブはISO文字列を解析する
+        days_diff = 0
+        last_action_epoch = state.get('last_action_epoch')
+        if last_action_epoch is not None:
+            days_diff = int((time.time() - last_action_epoch) // 86400)
+        else:
+            last_action_date = state.get('last_action_date')
+            if last_action_date:
+                try:
+                    last_time = datetime.fromisoformat(last_action_date)
+                    days_diff = (datetime.now() - last_time).days
+                except Exception as e:
+                    print(f"⚠️ 日付チェックエラー: {e}")
+        
+        if days_diff >= 1:
+            print(f"📅 {days_diff}日経過しました。新しい日の始まりです！")
+            # 新しい日の処理はGameEngineで行われるため、ここでは表示のみ
         
         # 旧式のセーブファイル（data/game_state.json）も確認
-        save_file = Path("data/game_state.json")
-        if save_file.exists():
-            try:
-                with open(save_file, 'r', encoding='utf-8') as f:
-                    old_state = json.load(f)
-                    # 旧式データがあれば、GameEngineの状態を優先
-                    print("📂 セーブデータを読み込みました")
-            except Exception as e:
-                print(f"⚠️ 旧式セーブデータ読み込みエラー: {e}")
+        # （内容はGameEngineの状態を優先するため読み込まず、存在だけを確認する）
+        if os.path.isfile(SAVE_FILE):
+            print("📂 セーブデータを読み込みました")
         else:
             print("🆕 新しいゲームを開始します")
     
-    def _save_game_state(self):
-        """ゲーム状態を保存"""
+    def _save_game_state(self, force: bool = False):
+        """ゲーム状態を保存
+        
+        直前の保存から SAVE_DEBOUNCE_SECONDS 以内の保存は保留し、次のメインメニュー表示時に
+        1回にまとめて書き込む（force=True で即時保存）。
+        """
+        if not force and time.monotonic() - self._last_save < SAVE_DEBOUNCE_SECONDS:
+            self._save_pending = True
+            return
+        
+        self._write_game_state()
+    
+    def _flush_pending_save(self):
+        """保留中の保存があれば書き込み（メインメニューの表示ごとに呼ぶ）"""
+        if self._save_pending:
+            self._write_game_state()
+    
+    def _write_game_state(self):
+        """ゲーム状態を書き込み"""
+        self._last_save = time.monotonic()
+        self._save_pending = False
+        
         # GameEngineの状態を保存（これがメインのセーブデータ）
         self.game_engine.save_state()
         self.game_engine.save_wallet()
         
-        # 旧式のセーブファイルも更新（互換性のため）
-        save_file = Path("data/game_state.json")
-        save_file.parent.mkdir(exist_ok=True)
+        # 旧式のセーブファイルは存在しないときだけ作成（dataディレクトリは起動時に作成済み）
+        if self._legacy_saved:
+            return
         
+        now = datetime.now()
+        now_iso = now.isoformat()
+        engine_state = self.game_engine.state
         state = {
             'current_day': self.current_day,
-            'last_action_time': datetime.now().isoformat(),
-            'save_time': datetime.now().isoformat(),
-            'experience': self.game_engine.state.get('experience', 0),
+            'last_action_time': now_iso,
+            'last_action_epoch': now.timestamp(),
+            'save_time': now_iso,
+            'experience': engine_state.get('experience', 0),
             'crypto_balance': self.game_engine.wallet['crypto_balance'],
-            'total_actions': self.game_engine.state.get('total_actions', 0)
+            'total_actions': engine_state.get('total_actions', 0)
         }
         
         try:
-            with open(save_file, 'w', encoding='utf-8') as f:
-                json.dump(state, f, ensure_ascii=False, indent=2)
+            # 人が読む必要はないためインデントなしで一括書き込み
+            write_text_atomic(SAVE_FILE, json.dumps(state, ensure_ascii=False, separators=(',', ':')), self._paranoid_save)
+            self._legacy_saved = True
         except Exception as e:
             print(f"❌ ゲーム状態保存エラー: {e}")
     
     def _show_main_menu(self):
         """メインメニューを表示"""
         while True:
-            # 画面をクリア（Windows用）
-            os.system('cls' if os.name == 'nt' else 'clear')
+            # 間引きで保留した保存を書き込む
+            self._flush_pending_save()
             
-            print(f"\n🏠 メインメニュー (Day {self.current_day})")
-            print("="*50)
-            print(f"💎 経験値: {self.game_engine.state.get('experience', 0)}")
-            print(f"💰 Crypto: {self.game_engine.wallet['crypto_balance']:.6f} XMR")
+            # 画面クリア（シェルを起動せずANSIエスケープで消去）から選択肢までを
+            # 1つの文字列に組み立て、1回の書き込みで表示する
+            frame = [
+                _CLEAR,
+                _MAIN_MENU_HEADER.format(
+                    day=self.current_day,
+                    experience=self.game_engine.state.get('experience', 0),
+                    crypto=self.game_engine.wallet['crypto_balance'],
+                ),
+            ]
             
             # デバッグモード表示
             if self.debug_mode:
-                print(f"🐛 デバッグモード: 有効")
+                frame.append("🐛 デバッグモード: 有効\n")
             
-            print()
+            # 日次ダッシュボード
+            frame.append("\n")
+            frame.append("\n".join(self._build_daily_dashboard()))
+            frame.append("\n\n")
             
-            # 日次ダッシュボードを表示
-            self._show_daily_dashboard()
-            print()
-            
-            print("📋 アクション選択:")
-            print("   1. 🚀 CEA計算記録・学習")
-            print("   2. ⚡ 発電方法記録・学習")
-            print("   3. 🔭 天体観測記録・学習")
-            print("   4. 🌍 世界観測（News Sensors）")
-            print("   5. 🏭 発電所ミッション")
-            print("   6. 🛸 ロケット研究と軌道力学")
-            print("   7. 📝 雑記記録")
-            print("   8. 📊 統計・履歴表示")
-            print("   9. 🎯 学習目標確認")
-            print("   10. 🎵 BGM変更")
-            print("   11. 💾 ゲーム保存")
-            print("   12. 📂 セーブデータ読み込み")
-            print("   13. 📅 次の日へ進む")
-            print("   14. 🔌 発電接続アシスタント")
-            print("   15. ❌ 終了")
+            frame.append(_MAIN_MENU_ACTIONS)
+            sys.stdout.write("".join(frame))
+            sys.stdout.flush()
             
             try:
                 choice = input(f"\n選択してください (1-15): ").strip()
@@ -244,59 +699,26 @@ class CryptoAdventureRPG:
                     self._toggle_debug_mode()
                     continue
                 
-                if choice == "1":
-                    self._cea_menu()
-                    input("\n🔙 メインメニューに戻るにはEnterを押してください...")
-                elif choice == "2":
-                    self._power_menu()
-                    input("\n🔙 メインメニューに戻るにはEnterを押してください...")
-                elif choice == "3":
-                    self._optics_menu()
-                    input("\n🔙 メインメニューに戻るにはEnterを押してください...")
-                elif choice == "4":
-                    self._world_observation_menu()
-                    input("\n🔙 メインメニューに戻るにはEnterを押してください...")
-                elif choice == "5":
-                    self._power_missions_menu()
-                    input("\n🔙 メインメニューに戻るにはEnterを押してください...")
-                elif choice == "6":
-                    self.rocket_system.main_menu()
-                elif choice == "7":
-                    self.journal_system.main_menu()
-                elif choice == "8":
-                    self._statistics_menu()
-                    input("\n🔙 メインメニューに戻るにはEnterを押してください...")
-                elif choice == "9":
-                    self._learning_goals_menu()
-                    input("\n🔙 メインメニューに戻るにはEnterを押してください...")
-                elif choice == "10":
-                    self._bgm_menu()
-                    input("\n🔙 メインメニューに戻るにはEnterを押してください...")
-                elif choice == "11":
-                    self._save_game_state()
-                    print("✅ ゲームを保存しました")
-                    input("\n🔙 メインメニューに戻るにはEnterを押してください...")
-                elif choice == "12":
-                    self._load_game_menu()
-                    input("\n🔙 メインメニューに戻るにはEnterを押してください...")
-                elif choice == "13":
-                    self._advance_to_next_day()
-                    input("\n🔙 メインメニューに戻るにはEnterを押してください...")
-                elif choice == "14":
-                    self.power_connection_system.main_menu()
-                elif choice == "15":
+                if choice == "15":
                     print("👋 ゲームを終了します。お疲れ様でした！")
                     break
-                else:
+                
+                entry = self._main_dispatch.get(choice)
+                if entry is None:
                     print("❌ 無効な選択です")
-                    input("\n🔙 メインメニューに戻るにはEnterを押してください...")
+                    pause = True
+                else:
+                    handler, pause = entry
+                    handler()
+                if pause:
+                    _read_key("\n🔙 いずれかのキーを押すとメインメニューに戻ります...")
                     
             except KeyboardInterrupt:
                 print("\n👋 ゲームを終了します")
                 break
             except Exception as e:
                 print(f"❌ エラーが発生しました: {e}")
-                input("\n🔙 メインメニューに戻るにはEnterを押してください...")
+                _read_key("\n🔙 いずれかのキーを押すとメインメニューに戻ります...")
     
     def _toggle_debug_mode(self):
         """デバッグモードの切り替え"""
@@ -304,48 +726,47 @@ class CryptoAdventureRPG:
             print("🐛 デバッグモードを無効にしました")
             self.debug_mode = False
         else:
-            print("🐛 デバッグモードを有効にしました")
-            print("💡 デバッグモードでは:")
-            print("   - 行動回数制限が無効になります")
-            print("   - 追加のデバッグ情報が表示されます")
-            print("   - ゲーム再起動まで有効です")
+            _render(
+                "🐛 デバッグモードを有効にしました",
+                "💡 デバッグモードでは:",
+                "   - 行動回数制限が無効になります",
+                "   - 追加のデバッグ情報が表示されます",
+                "   - ゲーム再起動まで有効です",
+            )
             self.debug_mode = True
         
-        input("\nEnterキーを押して続行...")
+        _read_key("\nいずれかのキーを押して続行...")
     
-    def _show_daily_dashboard(self):
-        """日次ダッシュボードを表示"""
-        print("📊 今日のダッシュボード")
-        print("-" * 30)
+    def _build_daily_dashboard(self) -> List[str]:
+        """日次ダッシュボードの表示行を組み立て"""
+        lines = ["📊 今日のダッシュボード", "-" * 30]
         
         # 今日の活動状況
         today_activities = self._get_today_activities()
         
         if today_activities:
-            print("✅ 今日の活動:")
-            for activity in today_activities:
-                print(f"   {activity}")
+            lines.append("✅ 今日の活動:")
+            lines.extend(f"   {activity}" for activity in today_activities)
         else:
-            print("📝 今日はまだ活動していません")
+            lines.append("📝 今日はまだ活動していません")
         
         # 推奨アクション
-        print(f"\n🎯 今日の推奨アクション:")
+        lines.append("\n🎯 今日の推奨アクション:")
         if not today_activities:
-            print("   🚀 新しい推進剤の組み合わせを試してみましょう")
-            print("   ⚡ 発電方法の研究を始めましょう")
-            print("   🔭 天体観測で新しい発見をしましょう")
+            lines.extend(_RECOMMENDED_ACTIONS_IDLE)
         else:
-            print("   💪 更なる高みを目指して活動を続けましょう！")
-            print("   🎯 学習目標の達成も忘れずに。")
+            lines.extend(_RECOMMENDED_ACTIONS_ACTIVE)
         
         # 連続活動ボーナス
         consecutive_days = self._get_consecutive_active_days()
         if consecutive_days > 1:
-            print(f"\n🔥 連続{consecutive_days}日活動中！")
+            lines.append(f"\n🔥 連続{consecutive_days}日活動中！")
             if consecutive_days >= 7:
-                print("   🏆 週間継続ボーナス獲得中！")
+                lines.append("   🏆 週間継続ボーナス獲得中！")
             elif consecutive_days >= 3:
-                print("   ⭐ 3日連続ボーナス獲得中！")
+                lines.append("   ⭐ 3日連続ボーナス獲得中！")
+        
+        return lines
     
     def _get_today_activities(self) -> List[str]:
         """今日の活動を取得"""
@@ -370,457 +791,246 @@ class CryptoAdventureRPG:
     
     def _get_consecutive_active_days(self) -> int:
         """連続活動日数を取得"""
+        # 活動のあった日付の集合を先に作り、遡る日ごとに履歴を数え直さない
+        active_dates = set()
+        for activity_type in _HISTORY_WALLET_KEYS:
+            try:
+                active_dates.update(self._activity_counts_by_date(activity_type))
+            except Exception as e:
+                print(f"❌ 活動カウントエラー: {e}")
+        
         consecutive_days = 0
         current_day = self.current_day
         
         # 過去の日を遡って連続活動日数を計算
-        while current_day > 0:
-            activities = self._get_previous_day_activities(current_day)
-            if activities:
-                consecutive_days += 1
-                current_day -= 1
-            else:
-                break
+        while current_day > 0 and self._get_date_string(current_day) in active_dates:
+            consecutive_days += 1
+            current_day -= 1
         
         return consecutive_days
     
-    def _cea_menu(self):
-        """CEA計算メニュー"""
-        print(f"\n🚀 CEA計算記録・学習システム")
-        print("="*40)
-        print("1. 📝 計算結果を記録")
-        print("2. 🎯 学習目標を確認")
-        print("3. 📚 計算履歴を表示")
-        print("4. 📊 統計を表示")
-        print("5. 🔥 推進剤リストを表示")
-        print("6. 🔙 戻る")
+    def _run_submenu(self, menu_text: str, prompt: str, dispatch: Dict, back_choice: str):
+        """サブメニューを表示し、選択に対応するハンドラを実行"""
+        sys.stdout.write(menu_text)
         
         try:
-            choice = input("選択してください (1-6): ").strip()
+            # サブメニューの選択肢は1桁のため、Enterを待たずに1キーで選択する
+            choice = _read_key(prompt)
             
-            if choice == "1":
-                result = self.cea_system.record_cea_calculation()
-                if result:
-                    # 報酬を計算
-                    reward = self._get_activity_reward("cea_calculation", result)
-                    
-                    # 活動をテキストファイルに記録
-                    log_details = result.copy()
-                    log_details.update(reward)
-                    self._record_activity("cea_calculation", log_details)
-                    
-                    # 履歴をGameEngineに保存
-                    self.game_engine.add_cea_result(result)
-                    
-                    # 報酬を付与
-                    self.game_engine.add_experience(reward['total_experience'])
-                    self.game_engine.add_crypto(reward['crypto_earned'])
-                    
-                    # 報酬表示
-                    print(f"\n🎁 報酬獲得!")
-                    print(f"   💎 基本報酬: +{reward['base_reward']} 経験値")
-                    if reward['bonus_reward'] > 0:
-                        print(f"   ⭐ 追加報酬: +{reward['bonus_reward']} 経験値")
-                    if reward['consecutive_bonus'] > 0:
-                        print(f"   🔥 連続活動ボーナス: +{reward['consecutive_bonus']} 経験値")
-                    print(f"   💰 Crypto: +{reward['crypto_earned']:.6f} XMR")
-                    print(f"   📊 総獲得経験値: {reward['total_experience']}")
-                    
-                    # 学習目標の完了チェック
-                    completed_goals = self.cea_system.check_goal_completion()
-                    for goal in completed_goals:
-                        self.game_engine.add_experience(goal['reward']['experience'])
-                        self.game_engine.add_crypto(goal['reward']['crypto'])
-                        print(f"🎉 学習目標達成: {goal['name']}!")
-                        print(f"   💎 経験値 +{goal['reward']['experience']}")
-                        print(f"   💰 Crypto +{goal['reward']['crypto']:.6f} XMR")
-                        print()  # 改行を追加
-                        
-            elif choice == "2":
-                # デバッグ除外: 学習目標確認は行動回数を消費しない
-                self.cea_system.show_learning_goals()
-            elif choice == "3":
-                # デバッグ除外: 履歴表示は行動回数を消費しない
-                self.cea_system.show_calculation_history()
-            elif choice == "4":
-                # デバッグ除外: 統計表示は行動回数を消費しない
-                stats = self.cea_system.get_calculation_statistics()
-                if stats['status'] == 'success':
-                    print(f"\n📊 CEA計算統計:")
-                    print(f"   総計算回数: {stats['total_calculations']}")
-                    print(f"   ユニーク推進剤: {stats['unique_propellants']}")
-                    print(f"   最高比推力: {stats['max_isp']} s")
-                    print(f"   最高圧力: {stats['max_pressure']} bar")
-                    print(f"\n🚀 推進剤使用統計:")
-                    print(f"   UDMH使用回数: {stats['udmh_usage']}")
-                    print(f"   フッ素(F2)使用回数: {stats['fluorine_usage']}")
-                    print(f"   高エネルギー酸化剤使用回数: {stats['high_energy_oxidizer_usage']}")
-                    print(f"   ヒドラジン族使用回数: {stats['hydrazine_family_usage']}")
-                    print(f"   炭化水素燃料使用回数: {stats['hydrocarbon_usage']}")
-                    print(f"   高濃度酸化剤使用回数: {stats['concentrated_oxidizer_usage']}")
-                    print(f"   危険推進剤使用回数: {stats['dangerous_propellant_usage']}")
-                else:
-                    print("📝 計算データがありません")
-            elif choice == "5":
-                # デバッグ除外: 推進剤リスト表示は行動回数を消費しない
-                self.cea_system.show_propellant_list()
-                input("\nEnterキーを押して続行...")
-            elif choice == "6":
+            if choice == back_choice:
                 return
-            else:
+            
+            handler = dispatch.get(choice)
+            if handler is None:
                 print("❌ 無効な選択です")
+            else:
+                handler()
                 
         except Exception as e:
             print(f"❌ エラーが発生しました: {e}")
     
+    def _process_learning_result(self, activity_type: str, result: Dict, add_history, learning_system):
+        """学習記録の結果から報酬を付与し、学習目標の達成をチェック"""
+        # 報酬を計算
+        reward = self._get_activity_reward(activity_type, result)
+        
+        # 活動をテキストファイルに記録
+        log_details = result.copy()
+        log_details.update(reward)
+        self._record_activity(activity_type, log_details)
+        
+        # 履歴をGameEngineに保存
+        add_history(result)
+        
+        # 報酬を付与
+        self.game_engine.add_experience(reward['total_experience'])
+        self.game_engine.add_crypto(reward['crypto_earned'])
+        
+        # 報酬表示
+        lines = [
+            "\n🎁 報酬獲得!",
+            f"   💎 基本報酬: +{reward['base_reward']} 経験値",
+        ]
+        if reward['bonus_reward'] > 0:
+            lines.append(f"   ⭐ 追加報酬: +{reward['bonus_reward']} 経験値")
+        if reward['consecutive_bonus'] > 0:
+            lines.append(f"   🔥 連続活動ボーナス: +{reward['consecutive_bonus']} 経験値")
+        lines.append(f"   💰 Crypto: +{reward['crypto_earned']:.6f} XMR")
+        lines.append(f"   📊 総獲得経験値: {reward['total_experience']}")
+        _render(*lines)
+        
+        # 学習目標の完了チェック
+        # （報酬付与時に GameEngine が直接表示するため、目標ごとにその表示の直後にまとめて表示する）
+        completed_goals = learning_system.check_goal_completion()
+        for goal in completed_goals:
+            self.game_engine.add_experience(goal['reward']['experience'])
+            self.game_engine.add_crypto(goal['reward']['crypto'])
+            _render(
+                f"🎉 学習目標達成: {goal['name']}!",
+                f"   💎 経験値 +{goal['reward']['experience']}",
+                f"   💰 Crypto +{goal['reward']['crypto']:.6f} XMR",
+                "",  # 改行を追加
+            )
+    
+    def _record_cea_calculation(self):
+        """CEA計算結果を記録"""
+        result = self.cea_system.record_cea_calculation()
+        if result:
+            self._process_learning_result(
+                "cea_calculation", result, self.game_engine.add_cea_result, self.cea_system
+            )
+    
+    def _record_power_generation(self):
+        """発電方法を記録"""
+        result = self.power_system.record_power_generation()
+        if result:
+            self._process_learning_result(
+                "power_generation", result, self.game_engine.add_power_plant_result, self.power_system
+            )
+    
+    def _record_optics_observation(self):
+        """天体観測を記録"""
+        result = self.optics_system.record_astronomical_observation()
+        if result:
+            self._process_learning_result(
+                "optics_observation", result, self.game_engine.add_optics_observation, self.optics_system
+            )
+    
+    def _render_stats(self, kind: str, stats: Dict, title: Optional[str] = None):
+        """統計テンプレートに沿って統計を1回の書き込みで表示（title で先頭の見出しを置き換え）"""
+        template = _STATS_TEMPLATES[kind]
+        if stats['status'] != 'success':
+            print(template['empty'])
+            return
+        
+        lines = []
+        for heading, fields in template['sections']:
+            lines.append(f"\n📊 {title}:" if title and not lines else heading)
+            for label, key, suffix in fields:
+                lines.append(f"   {label}: {stats[key]}{suffix}")
+        _render(*lines)
+    
+    def _show_cea_statistics(self):
+        """CEA計算統計を表示（行動回数を消費しない）"""
+        self._render_stats("cea", self.cea_system.get_calculation_statistics())
+    
+    def _show_power_statistics(self):
+        """発電統計を表示（行動回数を消費しない）"""
+        self._render_stats("power", self.power_system.get_generation_statistics())
+    
+    def _show_optics_statistics(self, title: str = "天体観測統計"):
+        """観測統計を表示（行動回数を消費しない）"""
+        stats = self.optics_system.get_observation_statistics()
+        if stats['status'] == 'success':
+            stats = dict(stats, equipment_types=len(stats['equipment_usage']))
+        self._render_stats("optics", stats, title)
+    
+    def _show_propellant_list(self):
+        """推進剤リストを表示（行動回数を消費しない）"""
+        self.cea_system.show_propellant_list()
+        _read_key("\nいずれかのキーを押して続行...")
+    
+    def _cea_menu(self):
+        """CEA計算メニュー"""
+        self._run_submenu(_CEA_MENU, "選択してください (1-6): ", self._cea_dispatch, "6")
+    
     def _power_menu(self):
         """発電方法メニュー"""
-        print(f"\n⚡ 発電方法記録・学習システム")
-        print("="*40)
-        print("1. 📝 発電方法を記録")
-        print("2. 🎯 学習目標を確認")
-        print("3. 📚 発電履歴を表示")
-        print("4. 📊 統計を表示")
-        print("5. 📖 発電方法ガイド")
-        print("6. 🔙 戻る")
-        
-        try:
-            choice = input("選択してください (1-6): ").strip()
-            
-            if choice == "1":
-                result = self.power_system.record_power_generation()
-                if result:
-                    # 報酬を計算
-                    reward = self._get_activity_reward("power_generation", result)
-                    
-                    # 活動をテキストファイルに記録
-                    log_details = result.copy()
-                    log_details.update(reward)
-                    self._record_activity("power_generation", log_details)
-                    
-                    # 履歴をGameEngineに保存
-                    self.game_engine.add_power_plant_result(result)
-                    
-                    # 報酬を付与
-                    self.game_engine.add_experience(reward['total_experience'])
-                    self.game_engine.add_crypto(reward['crypto_earned'])
-                    
-                    # 報酬表示
-                    print(f"\n🎁 報酬獲得!")
-                    print(f"   💎 基本報酬: +{reward['base_reward']} 経験値")
-                    if reward['bonus_reward'] > 0:
-                        print(f"   ⭐ 追加報酬: +{reward['bonus_reward']} 経験値")
-                    if reward['consecutive_bonus'] > 0:
-                        print(f"   🔥 連続活動ボーナス: +{reward['consecutive_bonus']} 経験値")
-                    print(f"   💰 Crypto: +{reward['crypto_earned']:.6f} XMR")
-                    print(f"   📊 総獲得経験値: {reward['total_experience']}")
-                    
-                    # 学習目標の完了チェック
-                    completed_goals = self.power_system.check_goal_completion()
-                    for goal in completed_goals:
-                        self.game_engine.add_experience(goal['reward']['experience'])
-                        self.game_engine.add_crypto(goal['reward']['crypto'])
-                        print(f"🎉 学習目標達成: {goal['name']}!")
-                        print(f"   💎 経験値 +{goal['reward']['experience']}")
-                        print(f"   💰 Crypto +{goal['reward']['crypto']:.6f} XMR")
-                        print()  # 改行を追加
-                        
-            elif choice == "2":
-                # デバッグ除外: 学習目標確認は行動回数を消費しない
-                self.power_system.show_learning_goals()
-            elif choice == "3":
-                # デバッグ除外: 履歴表示は行動回数を消費しない
-                self.power_system.show_generation_history()
-            elif choice == "4":
-                # デバッグ除外: 統計表示は行動回数を消費しない
-                stats = self.power_system.get_generation_statistics()
-                if stats['status'] == 'success':
-                    print(f"\n📊 発電統計:")
-                    print(f"   総記録数: {stats['total_records']}")
-                    print(f"   ユニーク方法: {stats['unique_methods']}")
-                    print(f"   総容量: {stats['total_capacity']} kW")
-                    print(f"   1日あたり発電量: {stats['total_daily_generation']} kWh")
-                else:
-                    print("📝 発電データがありません")
-            elif choice == "5":
-                # デバッグ除外: ガイド表示は行動回数を消費しない
-                self.power_system.show_power_methods_guide()
-            elif choice == "6":
-                return
-            else:
-                print("❌ 無効な選択です")
-                
-        except Exception as e:
-            print(f"❌ エラーが発生しました: {e}")
+        self._run_submenu(_POWER_MENU, "選択してください (1-6): ", self._power_dispatch, "6")
     
     def _optics_menu(self):
         """天体観測メニュー"""
-        print(f"\n🔭 天体観測記録・学習システム")
-        print("="*40)
-        print("1. 📝 観測を記録")
-        print("2. 🎯 学習目標を確認")
-        print("3. 📚 観測履歴を表示")
-        print("4. 📊 統計を表示")
-        print("5. 🔬 光学・天文学理論シミュレーション")
-        print("6. 🔙 戻る")
-        
-        try:
-            choice = input("選択してください (1-6): ").strip()
-            
-            if choice == "1":
-                result = self.optics_system.record_observation()
-                if result:
-                    # 報酬を計算
-                    reward = self._get_activity_reward("optics_observation", result)
-                    
-                    # 活動をテキストファイルに記録
-                    log_details = result.copy()
-                    log_details.update(reward)
-                    self._record_activity("optics_observation", log_details)
-                    
-                    # 履歴をGameEngineに保存
-                    self.game_engine.add_optics_observation(result)
-                    
-                    # 報酬を付与
-                    self.game_engine.add_experience(reward['total_experience'])
-                    self.game_engine.add_crypto(reward['crypto_earned'])
-                    
-                    # 報酬表示
-                    print(f"\n🎁 報酬獲得!")
-                    print(f"   💎 基本報酬: +{reward['base_reward']} 経験値")
-                    if reward['bonus_reward'] > 0:
-                        print(f"   ⭐ 追加報酬: +{reward['bonus_reward']} 経験値")
-                    if reward['consecutive_bonus'] > 0:
-                        print(f"   🔥 連続活動ボーナス: +{reward['consecutive_bonus']} 経験値")
-                    print(f"   💰 Crypto: +{reward['crypto_earned']:.6f} XMR")
-                    print(f"   📊 総獲得経験値: {reward['total_experience']}")
-                    
-                    # 学習目標の完了チェック
-                    completed_goals = self.optics_system.check_goal_completion()
-                    for goal in completed_goals:
-                        self.game_engine.add_experience(goal['reward']['experience'])
-                        self.game_engine.add_crypto(goal['reward']['crypto'])
-                        print(f"🎉 学習目標達成: {goal['name']}!")
-                        print(f"   💎 経験値 +{goal['reward']['experience']}")
-                        print(f"   💰 Crypto +{goal['reward']['crypto']:.6f} XMR")
-                        print()  # 改行を追加
-                        
-            elif choice == "2":
-                # デバッグ除外: 学習目標確認は行動回数を消費しない
-                self.optics_system.show_learning_goals()
-            elif choice == "3":
-                # デバッグ除外: 履歴表示は行動回数を消費しない
-                self.optics_system.show_observation_history()
-            elif choice == "4":
-                # デバッグ除外: 統計表示は行動回数を消費しない
-                stats = self.optics_system.get_observation_statistics()
-                if stats['status'] == 'success':
-                    print(f"\n📊 天体観測統計:")
-                    print(f"   総観測回数: {stats['total_observations']}")
-                    print(f"   ユニーク天体: {stats['unique_targets']}")
-                    print(f"   カテゴリ数: {stats['unique_categories']}")
-                    print(f"   使用機材: {len(stats['equipment_usage'])}種類")
-                else:
-                    print("📝 観測データがありません")
-            elif choice == "5":
-                return
-            else:
-                print("❌ 無効な選択です")
-                
-        except Exception as e:
-            print(f"❌ エラーが発生しました: {e}")
+        self._run_submenu(_OPTICS_MENU, "選択してください (1-6): ", self._optics_dispatch, "6")
     
-
     def _world_observation_menu(self):
         """世界観測メニュー"""
-        print(f"\n🌍 世界線観測・エネルギー追跡システム")
-        print("="*40)
-        print("1. 📡 現在の世界状態を観測・記録する")
-        print("2. 📊 観測履歴・レポートを表示する")
-        print("3. 🔬 世界線・歴史トレンド理論シミュレーション")
-        print("4. 🔙 戻る")
-        
-        try:
-            choice = input("選択してください (1-4): ").strip()
-            
-            if choice == "1":
-                self.world_observer.observe_and_record()
-            elif choice == "2":
-                self.world_observer.display_world_state()
-            elif choice == "3":
-                self.world_observer.show_theoretical_simulation_menu()
-            elif choice == "4":
-                return
-            else:
-                print("❌ 無効な選択です")
-        except Exception as e:
-            print(f"❌ エラーが発生しました: {e}")
+        self._run_submenu(
+            _WORLD_OBSERVATION_MENU, "選択してください (1-4): ", self._world_observation_dispatch, "4"
+        )
             
     def _power_missions_menu(self):
         """発電所ミッションメニュー"""
-        print(f"\n🏭 発電所ミッションシステム")
-        print("="*40)
-        print("1. 📋 ミッション一覧")
-        print("2. 📊 ミッション統計")
-        print("3. 💡 ミッションヒント")
-        print("4. 🔬 発電・エネルギー理論シミュレーション")
-        print("5. 🔙 戻る")
-        
-        try:
-            choice = input("選択してください (1-5): ").strip()
-            
-            if choice == "1":
-                # デバッグ除外: ミッション一覧は行動回数を消費しない
-                self.power_missions.show_missions()
-            elif choice == "2":
-                # デバッグ除外: ミッション統計は行動回数を消費しない
-                self.power_missions.show_mission_statistics()
-            elif choice == "3":
-                # デバッグ除外: ミッションヒントは行動回数を消費しない
-                self.power_missions.show_mission_hints()
-            elif choice == "4":
-                self.power_missions.show_theoretical_simulation_menu()
-            elif choice == "5":
-                return
-            else:
-                print("❌ 無効な選択です")
-                
-        except Exception as e:
-            print(f"❌ エラーが発生しました: {e}")
+        self._run_submenu(
+            _POWER_MISSIONS_MENU, "選択してください (1-5): ", self._power_missions_dispatch, "5"
+        )
     
     def _statistics_menu(self):
         """統計メニュー"""
-        print(f"\n📊 統計・履歴表示")
-        print("="*40)
-        print("1. 🎮 ゲーム統計")
-        print("2. 🚀 CEA統計")
-        print("3. ⚡ 発電統計")
-        print("4. 🔭 観測統計")
-        print("5. 🔙 戻る")
-        
-        try:
-            choice = input("選択してください (1-5): ").strip()
-            
-            if choice == "1":
-                # デバッグ除外: ゲーム統計は行動回数を消費しない
-                self._show_game_statistics()
-            elif choice == "2":
-                # デバッグ除外: CEA統計は行動回数を消費しない
-                stats = self.cea_system.get_calculation_statistics()
-                if stats['status'] == 'success':
-                    print(f"\n📊 CEA計算統計:")
-                    print(f"   総計算回数: {stats['total_calculations']}")
-                    print(f"   ユニーク推進剤: {stats['unique_propellants']}")
-                    print(f"   最高比推力: {stats['max_isp']} s")
-                    print(f"   最高圧力: {stats['max_pressure']} bar")
-                    print(f"\n🚀 推進剤使用統計:")
-                    print(f"   UDMH使用回数: {stats['udmh_usage']}")
-                    print(f"   フッ素(F2)使用回数: {stats['fluorine_usage']}")
-                    print(f"   高エネルギー酸化剤使用回数: {stats['high_energy_oxidizer_usage']}")
-                    print(f"   ヒドラジン族使用回数: {stats['hydrazine_family_usage']}")
-                    print(f"   炭化水素燃料使用回数: {stats['hydrocarbon_usage']}")
-                    print(f"   高濃度酸化剤使用回数: {stats['concentrated_oxidizer_usage']}")
-                    print(f"   危険推進剤使用回数: {stats['dangerous_propellant_usage']}")
-                else:
-                    print("📝 計算データがありません")
-            elif choice == "3":
-                # デバッグ除外: 発電統計は行動回数を消費しない
-                stats = self.power_system.get_generation_statistics()
-                if stats['status'] == 'success':
-                    print(f"\n📊 発電統計:")
-                    print(f"   総記録数: {stats['total_records']}")
-                    print(f"   ユニーク方法: {stats['unique_methods']}")
-                    print(f"   総容量: {stats['total_capacity']} kW")
-                    print(f"   1日あたり発電量: {stats['total_daily_generation']} kWh")
-                else:
-                    print("📝 発電データがありません")
-            elif choice == "4":
-                # デバッグ除外: 観測統計は行動回数を消費しない
-                stats = self.optics_system.get_observation_statistics()
-                if stats['status'] == 'success':
-                    print(f"\n📊 観測統計:")
-                    print(f"   総観測回数: {stats['total_observations']}")
-                    print(f"   ユニーク天体: {stats['unique_targets']}")
-                    print(f"   カテゴリ数: {stats['unique_categories']}")
-                    print(f"   使用機材: {len(stats['equipment_usage'])}種類")
-                else:
-                    print("📝 観測データがありません")
-            elif choice == "5":
-                return
-            else:
-                print("❌ 無効な選択です")
-                
-        except Exception as e:
-            print(f"❌ エラーが発生しました: {e}")
+        self._run_submenu(_STATISTICS_MENU, "選択してください (1-5): ", self._statistics_dispatch, "5")
     
     def _learning_goals_menu(self):
         """学習目標メニュー"""
-        print(f"\n🎯 学習目標確認")
-        print("="*40)
-        print("1. 🚀 CEA学習目標")
-        print("2. ⚡ 発電学習目標")
-        print("3. 🔭 観測学習目標")
-        print("4. 🔙 戻る")
-        
-        try:
-            choice = input("選択してください (1-4): ").strip()
-            
-            if choice == "1":
-                # デバッグ除外: 学習目標確認は行動回数を消費しない
-                self.cea_system.show_learning_goals()
-            elif choice == "2":
-                # デバッグ除外: 学習目標確認は行動回数を消費しない
-                self.power_system.show_learning_goals()
-            elif choice == "3":
-                # デバッグ除外: 学習目標確認は行動回数を消費しない
-                self.optics_system.show_learning_goals()
-            elif choice == "4":
-                return
-            else:
-                print("❌ 無効な選択です")
-                
-        except Exception as e:
-            print(f"❌ エラーが発生しました: {e}")
+        self._run_submenu(
+            _LEARNING_GOALS_MENU, "選択してください (1-4): ", self._learning_goals_dispatch, "4"
+        )
+    
+    def _rocket_menu(self):
+        """ロケット研究メニュー"""
+        self.rocket_system.main_menu()
+    
+    def _journal_menu(self):
+        """雑記記録メニュー"""
+        self.journal_system.main_menu()
+    
+    def _power_connection_menu(self):
+        """発電接続アシスタントメニュー"""
+        self.power_connection_system.main_menu()
+    
+    def _save_game_from_menu(self):
+        """メニューからゲームを保存（明示的な保存は間引かない）"""
+        self._save_game_state(force=True)
+        print("✅ ゲームを保存しました")
     
+
     def _show_game_statistics(self):
         """ゲーム統計を表示"""
-        print(f"\n🎮 ゲーム統計")
-        print("="*40)
-        print(f"📅 現在の日: {self.current_day}")
-        print(f"💎 経験値: {self.game_engine.state.get('experience', 0)}")
-        print(f"💰 Crypto: {self.game_engine.wallet['crypto_balance']:.6f} XMR")
-        
-        # 各システムの統計
+        # 各システムの統計（集計結果はシステム側でキャッシュされる）
         cea_stats = self.cea_system.get_calculation_statistics()
         power_stats = self.power_system.get_generation_statistics()
         optics_stats = self.optics_system.get_observation_statistics()
         
-        print(f"\n📊 アクティビティ統計:")
-        print(f"   🚀 CEA計算: {cea_stats.get('total_calculations', 0)}回")
-        print(f"   ⚡ 発電記録: {power_stats.get('total_records', 0)}回")
-        print(f"   🔭 観測記録: {optics_stats.get('total_observations', 0)}回")
+        lines = [
+            "\n🎮 ゲーム統計",
+            "="*40,
+            f"📅 現在の日: {self.current_day}",
+            f"💎 経験値: {self.game_engine.state.get('experience', 0)}",
+            f"💰 Crypto: {self.game_engine.wallet['crypto_balance']:.6f} XMR",
+            "\n📊 アクティビティ統計:",
+            f"   🚀 CEA計算: {cea_stats.get('total_calculations', 0)}回",
+            f"   ⚡ 発電記録: {power_stats.get('total_records', 0)}回",
+            f"   🔭 観測記録: {optics_stats.get('total_observations', 0)}回",
+        ]
+        _render(*lines)
     
     def _bgm_menu(self):
         """BGM変更メニュー"""
         print(f"\n🎵 BGM変更")
         print("="*40)
         
-        # 利用可能なBGMファイルを取得
-        bgm_files = self.game_engine.audio_manager.bgm_files
+        # 音声システムのバックグラウンド初期化を待機
+        self.game_engine.wait_for_background_init(BACKGROUND_INIT_TIMEOUT)
+        if self.game_engine.audio_manager is None:
+            print("❌ 音声システムが利用できません")
+            return
+        
+        # 利用可能なBGMファイルと表示名（検索時に作成済み）を取得
+        audio_manager = self.game_engine.audio_manager
+        bgm_files = audio_manager.bgm_files
+        bgm_names = audio_manager.bgm_names
         
         if not bgm_files:
             print("📝 BGMファイルが見つかりません")
             return
         
-        print("🎼 利用可能なBGM:")
-        for i, bgm_file in enumerate(bgm_files, 1):
-            # ファイル名から拡張子を除去して表示
-            bgm_name = Path(bgm_file).stem
-            current_indicator = " ← 現在再生中" if bgm_file == self.game_engine.audio_manager.current_bgm else ""
-            print(f"   {i}. {bgm_name}{current_indicator}")
+        lines = ["🎼 利用可能なBGM:"]
+        current_bgm = audio_manager.current_bgm
+        for i, (bgm_file, bgm_name) in enumerate(zip(bgm_files, bgm_names), 1):
+            current_indicator = " ← 現在再生中" if bgm_file == current_bgm else ""
+            lines.append(f"   {i}. {bgm_name}{current_indicator}")
         
-        print(f"   {len(bgm_files) + 1}. 🔇 BGM停止")
-        print(f"   {len(bgm_files) + 2}. 🔙 戻る")
+        lines.append(f"   {len(bgm_files) + 1}. 🔇 BGM停止")
+        lines.append(f"   {len(bgm_files) + 2}. 🔙 戻る")
+        _render(*lines)
         
         try:
             choice = input(f"選択してください (1-{len(bgm_files) + 2}): ").strip()
@@ -828,142 +1038,146 @@ class CryptoAdventureRPG:
             if not choice:
                 return
             
-            choice_idx = int(choice) - 1
+            choice_num = _parse_small_int(choice, len(bgm_files) + 2)
+            if choice_num < 0:
+                print("❌ 無効な入力です")
+                return
+            choice_idx = choice_num - 1
             
-            if 0 <= choice_idx < len(bgm_files):
+            if choice_idx < len(bgm_files):
                 # BGM変更
-                selected_bgm = bgm_files[choice_idx]
-                self.game_engine.audio_manager.change_bgm(selected_bgm)
-                bgm_name = Path(selected_bgm).stem
-                print(f"🎵 BGMを変更しました: {bgm_name}")
+                audio_manager.change_bgm(bgm_files[choice_idx])
+                print(f"🎵 BGMを変更しました: {bgm_names[choice_idx]}")
                 
             elif choice_idx == len(bgm_files):
                 # BGM停止
-                self.game_engine.audio_manager.stop_bgm()
+                audio_manager.stop_bgm()
                 print("🔇 BGMを停止しました")
                 
-            elif choice_idx == len(bgm_files) + 1:
+            else:
                 # 戻る
                 return
-            else:
-                print("❌ 無効な選択です")
                 
-        except ValueError:
-            print("❌ 無効な入力です")
         except Exception as e:
             print(f"❌ BGM変更エラー: {e}")
     
     def _load_game_menu(self):
         """セーブデータ読み込みメニュー"""
-        print(f"\n📂 セーブデータ読み込み")
-        print("="*40)
-        print("1. 🔄 現在のセーブデータを再読み込み")
-        print("2. 📊 セーブデータ情報を表示")
-        print("3. 🔍 セーブデータ整合性チェック")
-        print("4. 🔧 セーブデータ自動修復")
-        print("5. 🔙 戻る")
-        
-        try:
-            choice = input("選択してください (1-5): ").strip()
-            
-            if choice == "1":
-                self._reload_game_state()
-            elif choice == "2":
-                self._show_save_data_info()
-            elif choice == "3":
-                self._check_save_data_integrity()
-            elif choice == "4":
-                self._repair_save_data()
-            elif choice == "5":
-                return
-            else:
-                print("❌ 無効な選択です")
-                
-        except Exception as e:
-            print(f"❌ エラーが発生しました: {e}")
+        self._run_submenu(_LOAD_GAME_MENU, "選択してください (1-5): ", self._load_game_dispatch, "5")
     
     def _reload_game_state(self):
         """ゲーム状態を再読み込み"""
         print("🔄 ゲーム状態を再読み込み中...")
         
         # GameEngineの状態を再読み込み
-        self.game_engine.load_state()
-        self.game_engine.load_wallet()
+        self.game_engine.load_state_and_wallet()
         
         # 履歴データの同期
         self._sync_history_data()
         
-        # main.pyの状態をGameEngineと同期
-        self.current_day = self.game_engine.state.get('current_day', 1)
+        # main.pyの状態をGameEngineと同期（読み込み後の状態辞書をローカルに束縛）
+        state = self.game_engine.state
+        wallet = self.game_engine.wallet
+        self.current_day = state.get('current_day', 1)
         
         print("✅ ゲーム状態を再読み込みしました")
         print(f"   📅 現在の日: {self.current_day}日目")
-        print(f"   💰 Crypto残高: {self.game_engine.wallet['crypto_balance']:.6f} XMR")
-        print(f"   💎 経験値: {self.game_engine.state.get('experience', 0)}")
+        print(f"   💰 Crypto残高: {wallet['crypto_balance']:.6f} XMR")
+        print(f"   💎 経験値: {state.get('experience', 0)}")
         
         # 履歴情報も表示
-        cea_count = len(self.game_engine.wallet.get('cea_calculations', []))
-        power_count = len(self.game_engine.wallet.get('plant_designs', []))
-        optics_count = len(self.game_engine.wallet.get('optics_observations', []))
-        mining_count = len(self.game_engine.wallet.get('mining_history', []))
+        counts = _history_counts(wallet)
         
-        print(f"   📊 履歴: CEA{cea_count}回, 発電{power_count}回, 観測{optics_count}回, マイニング{mining_count}回")
+        print(
+            f"   📊 履歴: CEA{counts['cea_calculations']}回, 発電{counts['plant_designs']}回, "
+            f"観測{counts['optics_observations']}回, マイニング{counts['mining_history']}回"
+        )
+    
+    def _history_signature(self, path: Path) -> Tuple:
+        """履歴ファイル（スナップショットと追記ログ）の更新時刻とサイズ"""
+        signature = []
+        for p in (path, log_path(path)):
+            try:
+                st = os.stat(p)
+                signature.append((st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+    
+    def _load_system_history(self, system_name: str, attr: str, path: Path, key: str) -> List[Dict]:
+        """学習システムの履歴を読み込み、システム側の履歴として設定して返す"""
+        # 前回の読み込み以降ファイルが変わっていなければ、解析済みの履歴をそのまま使う
+        # （記録の追記や書き直しは更新時刻・サイズが変わるため、書き込み側での無効化は不要）
+        signature = self._history_signature(path)
+        cached = self._history_cache.get(path)
+        if cached and cached[0] == signature:
+            records = cached[1]
+        else:
+            records = load_records(path, key)
+            self._history_cache[path] = (signature, records)
+        
+        # 生成済みのシステムだけ履歴を差し替える（未生成のシステムはここでは生成せず、
+        # 初回アクセス時にシステム側が同じファイルを読み込む）
+        if system_name in self.__dict__:
+            setattr(self.__dict__[system_name], attr, records)
+        return records
     
-    def _sync_history_data(self):
-        """履歴データを同期"""
+    def _sync_history_data(self, persist: bool = True):
+        """履歴データを同期（persist=False のときは保存を呼び出し側に任せる）"""
         try:
-            # CEA計算履歴の同期
-            cea_file = self.data_dir / "cea_calculation" / "cea_calculations.json"
-            if cea_file.exists():
-                with open(cea_file, 'r', encoding='utf-8') as f:
-                    cea_data = json.load(f)
-                    if 'calculations' in cea_data:
-                        self.game_engine.wallet['cea_calculations'] = cea_data['calculations']
-                        # CEAシステムの履歴も同期
-                        self.cea_system.calculation_history = cea_data['calculations']
+            wallet = self.game_engine.wallet
+            state = self.game_engine.state
             
-            # 発電記録履歴の同期
-            power_file = self.data_dir / "power_generation" / "power_generations.json"
-            if power_file.exists():
-                with open(power_file, 'r', encoding='utf-8') as f:
-                    power_data = json.load(f)
-                    if 'generations' in power_data:
-                        self.game_engine.wallet['plant_designs'] = power_data['generations']
-                        # 発電システムの履歴も同期
-                        self.power_system.generation_history = power_data['generations']
-            
-            # 観測記録履歴の同期
-            optics_file = self.data_dir / "optics_observations" / "optics_observations.json"
-            if optics_file.exists():
-                with open(optics_file, 'r', encoding='utf-8') as f:
-                    optics_data = json.load(f)
-                    if 'observations' in optics_data:
-                        self.game_engine.wallet['optics_observations'] = optics_data['observations']
-                        # 観測システムの履歴も同期
-                        self.optics_system.observation_history = optics_data['observations']
+            # 各学習システムの履歴の同期
+            # （スナップショットと追記ログを合わせて読み込み、システム側の履歴とウォレットで共有）
+            # 各ファイルは独立しているため並行して読み込み、ウォレットへの反映はこのスレッドで行う
+            # 読めなかったファイルはどのファイルかを表示して飛ばし、他の履歴の同期は続ける
+            # スナップショットが削除されていれば作り直し、追記ログだけが残っている場合もその記録を読み込む
+            sources = [
+                source for source in _HISTORY_SOURCES
+                if os.path.isfile(source[2])
+                or self._restore_history_snapshot(source[2])
+                or os.path.isfile(log_path(source[2]))
+            ]
+            with ThreadPoolExecutor(max_workers=len(_HISTORY_SOURCES)) as executor:
+                futures = [
+                    (wallet_key, path, executor.submit(self._load_system_history, system_name, attr, path, key))
+                    for system_name, attr, path, key, wallet_key in sources
+                ]
+                for wallet_key, path, future in futures:
+                    try:
+                        wallet[wallet_key] = future.result()
+                    except (OSError, ValueError) as e:
+                        print(f"⚠️ 履歴ファイル読み込みエラー ({path}): {e}")
             
             # マイニング履歴の同期
-            mining_file = self.data_dir / "mining_activities" / "mining_sessions.json"
-            if mining_file.exists():
-                with open(mining_file, 'r', encoding='utf-8') as f:
-                    mining_data = json.load(f)
-                    if 'sessions' in mining_data:
-                        self.game_engine.wallet['mining_history'] = mining_data['sessions']
-                        # マイニングシステムの履歴も同期
-                        self.miner.mining_history = mining_data['sessions']
+            mining_file = MINING_HISTORY_FILE
+            if os.path.isfile(mining_file):
+                signature = self._history_signature(mining_file)
+                cached = self._history_cache.get(mining_file)
+                if cached and cached[0] == signature:
+                    sessions = cached[1]
+                else:
+                    try:
+                        with open(mining_file, 'r', encoding='utf-8') as f:
+                            sessions = json.load(f).get('sessions')
+                        self._history_cache[mining_file] = (signature, sessions)
+                    except (OSError, ValueError) as e:
+                        print(f"⚠️ 履歴ファイル読み込みエラー ({mining_file}): {e}")
+                        sessions = None
+                if sessions is not None:
+                    wallet['mining_history'] = sessions
+                    # マイニングシステムの履歴も同期
+                    self.miner.mining_history = sessions
             
             # 総行動回数を更新
-            total_activities = (
-                len(self.game_engine.wallet.get('cea_calculations', [])) +
-                len(self.game_engine.wallet.get('plant_designs', [])) +
-                len(self.game_engine.wallet.get('optics_observations', [])) +
-                len(self.game_engine.wallet.get('mining_history', []))
-            )
-            self.game_engine.state['total_actions'] = total_activities
+            total_activities = sum(_history_counts(wallet).values())
+            state['total_actions'] = total_activities
             
             # 同期されたデータを保存
-            self.game_engine.save_wallet()
-            self.game_engine.save_state()
+            if persist:
+                self.game_engine.save_wallet()
+                self.game_engine.save_state()
             
             print(f"✅ 履歴データを同期しました（総{total_activities}件）")
             
@@ -972,90 +1186,92 @@ class CryptoAdventureRPG:
     
     def _show_save_data_info(self):
         """セーブデータ情報を表示"""
-        print(f"\n📊 セーブデータ情報")
-        print("="*40)
-        
-        # GameEngineの状態情報
-        print("🎮 ゲーム状態:")
-        print(f"   📅 現在の日: {self.game_engine.state.get('current_day', 1)}日目")
-        print(f"   🏆 獲得称号数: {len(self.game_engine.state.get('titles', []))}")
-        print(f"   📈 総行動回数: {self.game_engine.state.get('total_actions', 0)}")
-        
-        print("\n💰 ウォレット情報:")
-        print(f"   💰 Crypto残高: {self.game_engine.wallet.get('crypto_balance', 0):.6f} XMR")
-        print(f"   💰 累積Crypto: {self.game_engine.wallet.get('total_crypto_balance', 0):.6f} XMR")
-        print(f"   ⚡ 消費電力: {self.game_engine.wallet.get('energy_consumed', 0):.2f} kWh")
-        print(f"   ⚡ 発電量: {self.game_engine.wallet.get('energy_generated', 0):.2f} kWh")
-        
-        print("\n📈 活動履歴:")
-        print(f"   ⛏️ マイニング回数: {len(self.game_engine.wallet.get('mining_history', []))}")
-        print(f"   🚀 CEA計算回数: {len(self.game_engine.wallet.get('cea_calculations', []))}")
-        print(f"   🏭 発電所設計回数: {len(self.game_engine.wallet.get('plant_designs', []))}")
-        print(f"   🔭 天体観測回数: {len(self.game_engine.wallet.get('optics_observations', []))}")
+        state = self.game_engine.state
+        wallet = self.game_engine.wallet
+        counts = _history_counts(wallet)
+        
+        lines = [
+            f"\n📊 セーブデータ情報",
+            "="*40,
+            # GameEngineの状態情報
+            "🎮 ゲーム状態:",
+            f"   📅 現在の日: {state.get('current_day', 1)}日目",
+            f"   🏆 獲得称号数: {len(state.get('titles', []))}",
+            f"   📈 総行動回数: {state.get('total_actions', 0)}",
+            "\n💰 ウォレット情報:",
+            f"   💰 Crypto残高: {wallet.get('crypto_balance', 0):.6f} XMR",
+            f"   💰 累積Crypto: {wallet.get('total_crypto_balance', 0):.6f} XMR",
+            f"   ⚡ 消費電力: {wallet.get('energy_consumed', 0):.2f} kWh",
+            f"   ⚡ 発電量: {wallet.get('energy_generated', 0):.2f} kWh",
+            "\n📈 活動履歴:",
+            f"   ⛏️ マイニング回数: {counts['mining_history']}",
+            f"   🚀 CEA計算回数: {counts['cea_calculations']}",
+            f"   🏭 発電所設計回数: {counts['plant_designs']}",
+            f"   🔭 天体観測回数: {counts['optics_observations']}",
+        ]
         
         # 最終更新日時
-        if 'last_action_date' in self.game_engine.state:
-            print(f"\n⏰ 最終更新: {self.game_engine.state['last_action_date'][:19]}")
+        if 'last_action_date' in state:
+            lines.append(f"\n⏰ 最終更新: {state['last_action_date'][:19]}")
+        
+        if 'game_start_date' in state:
+            lines.append(f"🎮 ゲーム開始: {state['game_start_date'][:19]}")
         
-        if 'game_start_date' in self.game_engine.state:
-            print(f"🎮 ゲーム開始: {self.game_engine.state['game_start_date'][:19]}")
+        _render(*lines)
     
     def _check_save_data_integrity(self):
         """セーブデータの整合性をチェック"""
-        print(f"\n🔍 セーブデータ整合性チェック")
-        print("="*40)
+        lines = [f"\n🔍 セーブデータ整合性チェック", "="*40]
         
         issues = []
         
         # GameEngineの状態チェック
-        if not hasattr(self.game_engine, 'state') or not self.game_engine.state:
+        state = getattr(self.game_engine, 'state', None)
+        wallet = getattr(self.game_engine, 'wallet', None)
+        if not state:
             issues.append("❌ GameEngineの状態が読み込まれていません")
         
-        if not hasattr(self.game_engine, 'wallet') or not self.game_engine.wallet:
+        if not wallet:
             issues.append("❌ GameEngineのウォレットが読み込まれていません")
         
         # 履歴データの整合性チェック
-        cea_calculations = self.game_engine.wallet.get('cea_calculations', [])
-        plant_designs = self.game_engine.wallet.get('plant_designs', [])
-        optics_observations = self.game_engine.wallet.get('optics_observations', [])
-        mining_history = self.game_engine.wallet.get('mining_history', [])
-        
-        total_activities = len(cea_calculations) + len(plant_designs) + len(optics_observations) + len(mining_history)
-        total_actions = self.game_engine.state.get('total_actions', 0)
+        counts = _history_counts(wallet)
+        total_activities = sum(counts.values())
+        total_actions = state.get('total_actions', 0)
         
         if total_activities != total_actions:
             issues.append(f"⚠️ 行動回数の不整合: 履歴{total_activities}回 vs 記録{total_actions}回")
         
         # 各システムのファイル存在チェック
-        cea_file = Path("data/cea_calculation/cea_calculations.json")
-        power_file = Path("data/power_generation/power_generations.json")
-        optics_file = Path("data/optics_observations/optics_observations.json")
+        cea_file = CEA_HISTORY_FILE
+        power_file = POWER_HISTORY_FILE
+        optics_file = OPTICS_HISTORY_FILE
         
-        if not cea_file.exists():
+        if not os.path.isfile(cea_file):
             issues.append("⚠️ CEA計算ファイルが見つかりません")
-        if not power_file.exists():
+        if not os.path.isfile(power_file):
             issues.append("⚠️ 発電記録ファイルが見つかりません")
-        if not optics_file.exists():
+        if not os.path.isfile(optics_file):
             issues.append("⚠️ 観測記録ファイルが見つかりません")
         
         # 結果表示
         if issues:
-            print("🔍 発見された問題:")
-            for issue in issues:
-                print(f"   {issue}")
-            print(f"\n💡 推奨対応:")
-            print("   1. セーブデータを再読み込みしてください")
-            print("   2. 問題が続く場合は、ゲームを再起動してください")
+            lines.append("🔍 発見された問題:")
+            lines.extend(f"   {issue}" for issue in issues)
+            lines.append(f"\n💡 推奨対応:")
+            lines.append("   1. セーブデータを再読み込みしてください")
+            lines.append("   2. 問題が続く場合は、ゲームを再起動してください")
         else:
-            print("✅ セーブデータに問題は見つかりませんでした")
-            print(f"   📊 総行動回数: {total_actions}回")
-            print(f"   📈 履歴データ: {total_activities}件")
-        
-        print(f"\n📊 詳細情報:")
-        print(f"   🚀 CEA計算: {len(cea_calculations)}回")
-        print(f"   ⚡ 発電記録: {len(plant_designs)}回")
-        print(f"   🔭 観測記録: {len(optics_observations)}回")
-        print(f"   ⛏️ マイニング: {len(mining_history)}回")
+            lines.append("✅ セーブデータに問題は見つかりませんでした")
+            lines.append(f"   📊 総行動回数: {total_actions}回")
+            lines.append(f"   📈 履歴データ: {total_activities}件")
+        
+        lines.append(f"\n📊 詳細情報:")
+        lines.append(f"   🚀 CEA計算: {counts['cea_calculations']}回")
+        lines.append(f"   ⚡ 発電記録: {counts['plant_designs']}回")
+        lines.append(f"   🔭 観測記録: {counts['optics_observations']}回")
+        lines.append(f"   ⛏️ マイニング: {counts['mining_history']}回")
+        _render(*lines)
     
     def _repair_save_data(self):
         """セーブデータを自動修復"""
@@ -1064,12 +1280,12 @@ class CryptoAdventureRPG:
         
         repaired = False
         
-        # 必要なファイルを初期化
-        self._initialize_history_files()
+        # 必要なファイルを初期化（削除された履歴ファイルも作り直す）
+        self._initialize_history_files(force=True)
         print("✅ 履歴ファイルを初期化しました")
         
-        # 履歴データを同期
-        self._sync_history_data()
+        # 履歴データを同期（保存は修復の最後にまとめて1回行う）
+        self._sync_history_data(persist=False)
         print("✅ 履歴データを同期しました")
         
         # 各システムの履歴を修復
@@ -1097,16 +1313,15 @@ class CryptoAdventureRPG:
         except Exception as e:
             print(f"⚠️ システム履歴修復エラー: {e}")
         
+        # 同期後の状態・ウォレットをローカルに束縛
+        state = self.game_engine.state
+        wallet = self.game_engine.wallet
+        
         # 総行動回数を修正
-        total_activities = (
-            len(self.game_engine.wallet.get('cea_calculations', [])) +
-            len(self.game_engine.wallet.get('plant_designs', [])) +
-            len(self.game_engine.wallet.get('optics_observations', [])) +
-            len(self.game_engine.wallet.get('mining_history', []))
-        )
+        total_activities = sum(_history_counts(wallet).values())
         
-        if self.game_engine.state.get('total_actions', 0) != total_activities:
-            self.game_engine.state['total_actions'] = total_activities
+        if state.get('total_actions', 0) != total_activities:
+            state['total_actions'] = total_activities
             print(f"✅ 総行動回数を修正しました: {total_activities}回")
             repaired = True
         
@@ -1130,7 +1345,7 @@ class CryptoAdventureRPG:
             date_str = self._get_date_string(self.current_day)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"activity_log_{date_str}_{timestamp}.txt"
-            filepath = self.data_dir / "activity_logs" / filename
+            filepath = ACTIVITY_LOG_DIR / filename
             
             # 活動ログを作成
             log_content = self._create_activity_log(activity_type, details, timestamp)
@@ -1226,22 +1441,14 @@ class CryptoAdventureRPG:
     
     def _get_activity_reward(self, activity_type: str, details: Dict) -> Dict:
         """活動に対する報酬を計算"""
-        base_rewards = {
-            'cea_calculation': 50,
-            'power_generation': 40,
-            'optics_observation': 30,
-            'mining_session': 25
-        }
-        
-        base_reward = base_rewards.get(activity_type, 10)
+        base_reward = _BASE_REWARDS.get(activity_type, 10)
         bonus_reward = 0
         crypto_earned = 0
         
         # 活動タイプに応じた追加報酬
         if activity_type == "cea_calculation":
             # 高エネルギー推進剤の使用でボーナス
-            high_energy_propellants = ['UDMH', 'F2', 'ClF3', 'N2F4']
-            if details.get('fuel') in high_energy_propellants or details.get('oxidizer') in high_energy_propellants:
+            if details.get('fuel') in _HIGH_ENERGY_PROPELLANTS or details.get('oxidizer') in _HIGH_ENERGY_PROPELLANTS:
                 bonus_reward += 20
                 crypto_earned += 0.001
             
@@ -1283,13 +1490,14 @@ class CryptoAdventureRPG:
     
     def _advance_to_next_day(self):
         """次の日へ進む"""
-        print(f"\n📅 次の日へ進む")
-        print("="*40)
-        
         # 現在の状態を表示
-        print(f"現在の日: Day {self.current_day}")
-        print(f"経験値: {self.game_engine.state.get('experience', 0)}")
-        print(f"Crypto: {self.game_engine.wallet['crypto_balance']:.6f} XMR")
+        _render(
+            "\n📅 次の日へ進む",
+            "="*40,
+            f"現在の日: Day {self.current_day}",
+            f"経験値: {self.game_engine.state.get('experience', 0)}",
+            f"Crypto: {self.game_engine.wallet['crypto_balance']:.6f} XMR",
+        )
         
         # 連続活動ボーナスを計算
         consecutive_days = self._get_consecutive_active_days()
@@ -1327,31 +1535,26 @@ class CryptoAdventureRPG:
     
     def _show_daily_report(self):
         """日報を表示"""
-        print(f"\n📊 Day {self.current_day} 日報")
-        print("-" * 30)
+        lines = [f"\n📊 Day {self.current_day} 日報", "-" * 30]
         
         # 前日の統計を表示
         previous_day = self.current_day - 1
         if previous_day > 0:
-            print(f"📈 Day {previous_day} の成果:")
+            lines.append(f"📈 Day {previous_day} の成果:")
             
             # 前日の実際の活動を取得
             previous_activities = self._get_previous_day_activities(previous_day)
             
             if previous_activities:
-                print("   📝 前日の活動記録:")
-                for activity in previous_activities:
-                    print(f"      {activity}")
+                lines.append("   📝 前日の活動記録:")
+                lines.extend(f"      {activity}" for activity in previous_activities)
             else:
-                print("   📝 前日は休憩日でした")
+                lines.append("   📝 前日は休憩日でした")
         
         # 新しい日の目標
-        print(f"\n🎯 Day {self.current_day} の目標:")
-        print("   💪 3つの行動を活用して学習を進めましょう")
-        print("   🚀 新しい推進剤の組み合わせを試してみましょう")
-        print("   ⚡ 発電方法の研究を深めましょう")
-        print("   🔭 天体観測で新しい発見をしましょう")
-        print("   ⛏️ マイニングでCryptoを稼ぎましょう")
+        lines.append(f"\n🎯 Day {self.current_day} の目標:")
+        lines.extend(_DAILY_GOALS)
+        _render(*lines)
     
     def _get_previous_day_activities(self, day: int) -> List[str]:
         """指定日の実際の活動を取得"""
@@ -1382,18 +1585,33 @@ class CryptoAdventureRPG:
         
         return activities
     
+    def _activity_counts_by_date(self, activity_type: str) -> Dict[str, int]:
+        """履歴の日付（YYYY-MM-DD）ごとの活動回数
+        
+        履歴は追記のみのため、前回の集計以降に増えた記録だけを数え足す。
+        同期などで履歴リストが差し替えられた場合は数え直す。
+        """
+        activities = self.game_engine.wallet.get(activity_type, [])
+        cached = self._activity_count_cache.get(activity_type)
+        if cached is None or cached[0] is not activities or cached[1] > len(activities):
+            cached = (activities, 0, {})
+        _, counted, counts = cached
+        
+        for activity in activities[counted:]:
+            # 日時が無い・不正な記録はどの日にも数えない（メニュー表示を止めない）
+            timestamp = activity.get('timestamp') if isinstance(activity, dict) else None
+            if not isinstance(timestamp, str):
+                continue
+            date = timestamp[:10]
+            counts[date] = counts.get(date, 0) + 1
+        
+        self._activity_count_cache[activity_type] = (activities, len(activities), counts)
+        return counts
+    
     def _count_activities_by_date(self, activity_type: str, date_str: str) -> int:
         """指定日の活動回数をカウント"""
         try:
-            activities = self.game_engine.wallet.get(activity_type, [])
-            count = 0
-            
-            for activity in activities:
-                timestamp = activity.get('timestamp', '')
-                if timestamp.startswith(date_str):
-                    count += 1
-            
-            return count
+            return self._activity_counts_by_date(activity_type).get(date_str, 0)
         except Exception as e:
             print(f"❌ 活動カウントエラー: {e}")
             return 0
@@ -6,6 +6,7 @@
 ゲームに反映させるモジュール
 """
 
+import atexit
 import json
 import os
 import time
@@ -16,6 +17,7 @@ from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import logging
+import logging.handlers
 
 class RealityConnector:
     def __init__(self, data_dir: Path):
@@ -23,13 +25,18 @@ class RealityConnector:
         self.logs_dir = data_dir / "logs"
         self.logs_dir.mkdir(exist_ok=True)
         
-        # ログ設定
+        # ログ設定（監視ループの1件ごとの書き込みを避けるため、メモリ上でまとめてから書き出す）
+        # 警告以上は即座に書き出し、それ以外も監視1回ごと・終了時に書き出す（異常終了で失われないように）
+        file_handler = logging.FileHandler(self.logs_dir / 'reality_connector.log', encoding='utf-8')
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        self._log_buffer = logging.handlers.MemoryHandler(
+            capacity=50, flushLevel=logging.WARNING, target=file_handler
+        )
+        atexit.register(self._log_buffer.flush)
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.logs_dir / 'reality_connector.log', encoding='utf-8')
-            ]
+            handlers=[self._log_buffer]
         )
         self.logger = logging.getLogger(__name__)
         
@@ -46,11 +53,17 @@ class RealityConnector:
                 'type': 'general'
             }
         }
+        # 判定用の小文字キーワード（監視ループ中は不変のため一度だけ作成）
+        self._process_keywords = {
+            process_type: tuple(keyword.lower() for keyword in config['keywords'])
+            for process_type, config in self.monitored_processes.items()
+        }
         
         # 監視状態
         self.monitoring_active = False
         self.monitor_thread = None
         self.activity_log = []
+        self._logged_processes = set()  # ログ出力済みの (種別, PID)
         
         # 設定ファイル
         self.config_file = self.data_dir / "reality_config.json"
@@ -67,6 +80,11 @@ class RealityConnector:
                 self.create_default_config()
         else:
             self.create_default_config()
+        
+        # 監視対象ディレクトリのPathは設定読み込み時に一度だけ作成
+        self._watch_paths = [
+            Path(watch_dir) for watch_dir in self.config['file_watchers']['watch_dirs']
+        ]
     
     def create_default_config(self):
         """デフォルト設定の作成"""
@@ -120,44 +138,63 @@ class RealityConnector:
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
         self.logger.info("現実連動監視を停止しました")
+        self._log_buffer.flush()
     
     def _monitor_loop(self):
         """監視ループ"""
+        # 処理時間で周期がずれないよう、絶対時刻の締め切りで次回の監視を待つ
+        next_tick = time.monotonic()
         while self.monitoring_active:
             try:
-                self._check_processes()
-                self._check_file_changes()
-                self._check_power_consumption()
-                time.sleep(self.config['monitoring']['interval'])
+                # 1回の監視で検出した活動には同じタイムスタンプを使う
+                timestamp = datetime.now().isoformat()
+                self._check_processes(timestamp)
+                self._check_file_changes(timestamp)
+                self._check_power_consumption(timestamp)
+                next_tick += self.config['monitoring']['interval']
             except Exception as e:
                 self.logger.error(f"監視ループでエラー: {e}")
-                time.sleep(10)
+                next_tick = time.monotonic() + 10
+            finally:
+                # 監視1回分のログをまとめて書き出す
+                self._log_buffer.flush()
+            
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # 処理が周期を超えた場合は遅れを取り戻そうとせず、現在時刻から再開
+                next_tick = time.monotonic()
     
-    def _check_processes(self):
+    def _check_processes(self, timestamp: str):
         """プロセス監視"""
+        detected = set()  # 今回の監視で検出した (種別, PID)
         for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
             try:
                 proc_info = proc.info
-                for process_type, config in self.monitored_processes.items():
-                    if self._is_target_process(proc_info, config):
-                        self._handle_process_activity(process_type, proc_info)
+                name = (proc_info.get('name') or '').lower()
+                cmdline = ' '.join(proc_info.get('cmdline') or []).lower()
+                for process_type, keywords in self._process_keywords.items():
+                    if self._is_target_process(name, cmdline, keywords):
+                        self._handle_process_activity(process_type, proc_info, timestamp)
+                        detected.add((process_type, proc_info.get('pid')))
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
-    
-    def _is_target_process(self, proc_info: Dict, config: Dict) -> bool:
-        """対象プロセスかどうか判定"""
-        name = proc_info.get('name', '').lower()
-        cmdline = ' '.join(proc_info.get('cmdline', [])).lower()
         
-        for keyword in config['keywords']:
-            if keyword.lower() in name or keyword.lower() in cmdline:
+        # 終了したプロセスはログ出力済みから外す（PIDが再利用されても新しいプロセスとしてログを出す）
+        self._logged_processes &= detected
+    
+    def _is_target_process(self, name: str, cmdline: str, keywords: tuple) -> bool:
+        """対象プロセスかどうか判定（name/cmdline/keywords は小文字化済み）"""
+        for keyword in keywords:
+            if keyword in name or keyword in cmdline:
                 return True
         return False
     
-    def _handle_process_activity(self, process_type: str, proc_info: Dict):
+    def _handle_process_activity(self, process_type: str, proc_info: Dict, timestamp: str):
         """プロセス活動の処理"""
         activity = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'type': process_type,
             'process_name': proc_info.get('name', ''),
             'pid': proc_info.get('pid'),
@@ -165,35 +202,41 @@ class RealityConnector:
         }
         
         self.activity_log.append(activity)
-        self.logger.info(f"プロセス活動検出: {process_type} - {proc_info.get('name', '')}")
+        
+        # 同じプロセスは監視のたびに検出されるため、ログは初回検出時のみ出力
+        log_key = (process_type, proc_info.get('pid'))
+        if log_key not in self._logged_processes:
+            self._logged_processes.add(log_key)
+            self.logger.info(f"プロセス活動検出: {process_type} - {proc_info.get('name', '')}")
     
-    def _check_file_changes(self):
+    def _check_file_changes(self, timestamp: str):
         """ファイル変更監視"""
         if not self.config['file_watchers']['enabled']:
             return
         
-        for watch_dir in self.config['file_watchers']['watch_dirs']:
-            watch_path = Path(watch_dir)
+        # 変更判定の基準時刻は1回の監視につき1度だけ取得
+        now = time.time()
+        for watch_path in self._watch_paths:
             if not watch_path.exists():
                 continue
             
             for pattern in self.config['file_watchers']['file_patterns']:
                 for file_path in watch_path.glob(pattern):
-                    if self._is_recently_modified(file_path):
-                        self._handle_file_activity(file_path)
+                    if self._is_recently_modified(file_path, now):
+                        self._handle_file_activity(file_path, timestamp)
     
-    def _is_recently_modified(self, file_path: Path) -> bool:
+    def _is_recently_modified(self, file_path: Path, now: float) -> bool:
         """ファイルが最近変更されたかチェック"""
         try:
             mtime = file_path.stat().st_mtime
-            return time.time() - mtime < 300  # 5分以内
+            return now - mtime < 300  # 5分以内
         except:
             return False
     
-    def _handle_file_activity(self, file_path: Path):
+    def _handle_file_activity(self, file_path: Path, timestamp: str):
         """ファイル活動の処理"""
         activity = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'type': 'file_change',
             'file_path': str(file_path),
             'activity': 'modified'
@@ -202,7 +245,7 @@ class RealityConnector:
         self.activity_log.append(activity)
         self.logger.info(f"ファイル変更検出: {file_path}")
     
-    def _check_power_consumption(self):
+    def _check_power_consumption(self, timestamp: str):
         """電力消費監視"""
         try:
             # CPU使用率から概算電力消費を計算
@@ -213,7 +256,7 @@ class RealityConnector:
             estimated_power = (cpu_percent * 0.1) + (memory_percent * 0.05)  # kWh
             
             activity = {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'type': 'power_consumption',
                 'cpu_percent': cpu_percent,
                 'memory_percent': memory_percent,
@@ -269,17 +312,21 @@ class RealityConnector:
         # CEAデータの同期
         cea_data = self.get_cea_data()
         if cea_data:
-            game_engine.add_cea_result(cea_data)
+            game_engine.record_cea_result(cea_data)
             sync_results['cea_synced'] = True
             self.logger.info("CEAデータをゲームに同期しました")
         
         # 発電所データの同期
         power_plant_data = self.get_power_plant_data()
         if power_plant_data:
-            game_engine.add_plant_design(power_plant_data)
+            game_engine.record_power_plant_result(power_plant_data)
             sync_results['power_plant_synced'] = True
             self.logger.info("発電所データをゲームに同期しました")
         
+        # 称号チェックと保存は同期1回につき1度だけ
+        if sync_results['cea_synced'] or sync_results['power_plant_synced']:
+            game_engine.end_action()
+        
         return sync_results
     
     def get_activity_summary(self) -> Dict: